@@ -26,9 +26,24 @@ are set for retrieval by the main window.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
-
-from PyQt6.QtCore import QDate, QLocale, QRect, Qt, pyqtSignal
+import importlib.util
+import sys
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from PyQt6.QtCore import (
+    QAbstractTableModel,
+    QDate,
+    QLocale,
+    QModelIndex,
+    QRect,
+    Qt,
+    QTimer,
+    pyqtSignal,
+)
 from PyQt6.QtGui import QColor, QFont, QPainter, QPen
 from PyQt6.QtWidgets import (
     QButtonGroup,
@@ -44,14 +59,12 @@ from PyQt6.QtWidgets import (
     QHeaderView,
     QLabel,
     QListWidget,
-    QListWidgetItem,
     QPushButton,
     QRadioButton,
     QScrollArea,
     QSpinBox,
     QTabWidget,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -59,17 +72,36 @@ from PyQt6.QtWidgets import (
 # ---------------------------------------------------------------------------
 # Hebrew date utilities (simplified conversion)
 # ---------------------------------------------------------------------------
-# A full Hebrew calendar implementation is complex.  We provide a
-# lightweight conversion table for the years 5784–5800 that covers
-# the expected range.  For dates outside this range the Hebrew date
-# display will show a placeholder.  In production this should be
-# replaced by a robust library such as ``hdate`` or ``pyluach``.
+# Conversion prefers hebrew_calendar.py, then ``hdate`` or ``pyluach``
+# when installed, and finally the dependency-free arithmetic below.
 
-_HEBREW_MONTHS = [
-    "Nisan", "Iyar", "Sivan", "Tammuz", "Av", "Elul",
+# Month names in calendar order from Tishrei, interned once so every
+# converter hands out the same string objects.
+_TISHREI_MONTHS_COMMON: Tuple[str, ...] = tuple(sys.intern(n) for n in (
     "Tishrei", "Cheshvan", "Kislev", "Tevet", "Shevat", "Adar",
-    "Adar I", "Adar II",
-]
+    "Nisan", "Iyar", "Sivan", "Tammuz", "Av", "Elul",
+))
+_TISHREI_MONTHS_LEAP: Tuple[str, ...] = tuple(sys.intern(n) for n in (
+    "Tishrei", "Cheshvan", "Kislev", "Tevet", "Shevat", "Adar I",
+    "Adar II", "Nisan", "Iyar", "Sivan", "Tammuz", "Av", "Elul",
+))
+
+# pyluach numbers months from Nisan (1) with Adar II as 13.  In leap years
+# month 12 is shown as "Adar I" instead, matching the tables above.
+_PYLUACH_MONTH_NAMES: Dict[int, str] = {
+    i: sys.intern(n) for i, n in enumerate((
+        "Nisan", "Iyar", "Sivan", "Tammuz", "Av", "Elul",
+        "Tishrei", "Cheshvan", "Kislev", "Tevet", "Shevat",
+        "Adar", "Adar II",
+    ), 1)
+}
+
+
+# Optional third-party converters.  Availability is probed once with
+# find_spec (no import, no ImportError); the libraries themselves are
+# only imported when hebrew_calendar.py cannot answer.
+_HAS_HDATE = importlib.util.find_spec("hdate") is not None
+_HAS_PYLUACH = importlib.util.find_spec("pyluach") is not None
 
 
 def _is_hebrew_leap_year(year: int) -> bool:
@@ -77,37 +109,155 @@ def _is_hebrew_leap_year(year: int) -> bool:
     return (7 * year + 1) % 19 < 7
 
 
+# Arithmetic calendar (Dershowitz & Reingold, "Calendrical Calculations"),
+# used when neither hebrew_calendar.py nor a third-party library is present.
+# Dates are counted as rata die (R.D. 1 = 1 January 1 CE).
+_HEBREW_EPOCH_RD = -1373427         # R.D. of 1 Tishrei 1
+_JD_TO_RD = 1721425                 # Julian Day Number of R.D. 0
+
+
+def _hebrew_calendar_elapsed_days(year: int) -> int:
+    """Days from the epoch to the molad of Tishrei of *year* (first dechiya applied)."""
+    months_elapsed = (235 * year - 234) // 19
+    parts_elapsed = 12084 + 13753 * months_elapsed
+    days = 29 * months_elapsed + parts_elapsed // 25920
+    return days + 1 if (3 * (days + 1)) % 7 < 3 else days
+
+
+@lru_cache(maxsize=256)
+def _hebrew_new_year_rd(year: int) -> int:
+    """Return the rata die of 1 Tishrei of Hebrew *year* (all four dechiyot)."""
+    ny0 = _hebrew_calendar_elapsed_days(year - 1)
+    ny1 = _hebrew_calendar_elapsed_days(year)
+    ny2 = _hebrew_calendar_elapsed_days(year + 1)
+    if ny2 - ny1 == 356:
+        correction = 2
+    elif ny1 - ny0 == 382:
+        correction = 1
+    else:
+        correction = 0
+    return _HEBREW_EPOCH_RD + ny1 + correction
+
+
 def _hebrew_year_days(year: int) -> int:
     """Return the number of days in Hebrew *year*."""
-    # Simplified: leap years have 383–385 days, regular 353–355.
-    # We approximate with the most common lengths.
-    return 385 if _is_hebrew_leap_year(year) else 355
+    return _hebrew_new_year_rd(year + 1) - _hebrew_new_year_rd(year)
+
+
+def _build_year_shape(year_len: int) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+    """Return cumulative month ends and month names for a year of *year_len* days."""
+    cheshvan = 30 if year_len % 10 == 5 else 29
+    kislev = 29 if year_len % 10 == 3 else 30
+    if year_len > 355:
+        lengths = (30, cheshvan, kislev, 29, 30, 30, 29, 30, 29, 30, 29, 30, 29)
+        names = _TISHREI_MONTHS_LEAP
+    else:
+        lengths = (30, cheshvan, kislev, 29, 30, 29, 30, 29, 30, 29, 30, 29)
+        names = _TISHREI_MONTHS_COMMON
+    return tuple(accumulate(lengths)), names
+
+
+# The six possible year lengths fully determine the month layout.
+_YEAR_SHAPES: Dict[int, Tuple[Tuple[int, ...], Tuple[str, ...]]] = {
+    n: _build_year_shape(n) for n in (353, 354, 355, 383, 384, 385)
+}
+
+
+def _hebrew_year_for_rd(rd: int) -> int:
+    """Return the Hebrew year containing rata die *rd*."""
+    # Mean year length is 35975351/98496 days; the estimate is off by at
+    # most one year, which one comparison against Rosh Hashana settles.
+    year = (rd - _HEBREW_EPOCH_RD) * 98496 // 35975351 + 1
+    if _hebrew_new_year_rd(year + 1) <= rd:
+        year += 1
+    elif _hebrew_new_year_rd(year) > rd:
+        year -= 1
+    return year
+
+
+# Hebrew dates as structured (day, month name, year) parts, so callers
+# that need a piece of the date do not have to re-parse a formatted string.
+_HebrewParts = Tuple[int, str, int]
+
+
+def _hebrew_parts_arithmetic(jd: int) -> _HebrewParts:
+    """Return the Hebrew date parts for Julian day *jd* without any library."""
+    rd = jd - _JD_TO_RD
+    year = _hebrew_year_for_rd(rd)
+    day = rd - _hebrew_new_year_rd(year)
+    cum, names = _YEAR_SHAPES[_hebrew_year_days(year)]
+    idx = bisect_right(cum, day)
+    if idx:
+        day -= cum[idx - 1]
+    return day + 1, names[idx], year
+
+
+def _hebrew_date_arithmetic(jd: int) -> str:
+    """Return the Hebrew date string for Julian day *jd* without any library."""
+    day, month, year = _hebrew_parts_arithmetic(jd)
+    return f"{day} {month}, {year}"
+
+
+def _hebrew_parts_run(first_jd: int, count: int) -> List[_HebrewParts]:
+    """Return Hebrew date parts for *count* consecutive days from *first_jd*.
 
+    Batch form of :func:`_hebrew_parts_arithmetic` for filling a calendar
+    month: the year and its month table are resolved once and only
+    re-resolved when the run crosses Rosh Hashana.
+    """
+    rd = first_jd - _JD_TO_RD
+    year = _hebrew_year_for_rd(rd)
+    new_year = _hebrew_new_year_rd(year)
+    cum, names = _YEAR_SHAPES[_hebrew_year_days(year)]
+    result: List[_HebrewParts] = []
+    for rd in range(rd, rd + count):
+        day = rd - new_year
+        if day >= cum[-1]:
+            year += 1
+            new_year += cum[-1]
+            cum, names = _YEAR_SHAPES[_hebrew_year_days(year)]
+            day = rd - new_year
+        idx = bisect_right(cum, day)
+        if idx:
+            day -= cum[idx - 1]
+        result.append((day + 1, names[idx], year))
+    return result
+
+
+@lru_cache(maxsize=4096)
+def _hebrew_date_for_jd(jd: int) -> str:
+    """Return the Hebrew date string for Julian day *jd*.
 
-def _gregorian_to_hebrew_approx(gdate: QDate) -> str:
-    """Return a Hebrew date string.  Uses hebrew_calendar.py (accurate) when available."""
+    Memoised for the lifetime of the process: calendar paging, the year
+    spinbox and repeated dialog opens keep asking for the same days.
+    """
+    gdate = QDate.fromJulianDay(jd)
     if _HC_AVAILABLE:
         try:
             return _hc_date_str(gdate.year(), gdate.month(), gdate.day())
         except Exception:
             pass
     # Fallback to external libraries
-    try:
-        from hdate import HDate  # type: ignore[import-untyped]
-        hd = HDate(gdate.toPyDate(), hebrew=False)
-        return f"{hd.hdate_he_str()}"
-    except Exception:
-        pass
-    try:
-        from pyluach.dates import GregorianDate  # type: ignore[import-untyped]
-        gd = GregorianDate(gdate.year(), gdate.month(), gdate.day())
-        hd = gd.to_heb()
-        mn = {1:"Nisan",2:"Iyar",3:"Sivan",4:"Tammuz",5:"Av",6:"Elul",
-              7:"Tishrei",8:"Cheshvan",9:"Kislev",10:"Tevet",11:"Shevat",
-              12:"Adar",13:"Adar II"}
-        return f"{hd.day} {mn.get(hd.month, str(hd.month))}, {hd.year}"
-    except Exception:
-        return ""
+    if _HAS_HDATE:
+        try:
+            from hdate import HDate  # type: ignore[import-untyped]
+            hd = HDate(gdate.toPyDate(), hebrew=False)
+            return f"{hd.hdate_he_str()}"
+        except Exception:
+            pass
+    if _HAS_PYLUACH:
+        try:
+            from pyluach.dates import GregorianDate  # type: ignore[import-untyped]
+            gd = GregorianDate(gdate.year(), gdate.month(), gdate.day())
+            hd = gd.to_heb()
+            if hd.month == 12 and _is_hebrew_leap_year(hd.year):
+                month = "Adar I"
+            else:
+                month = _PYLUACH_MONTH_NAMES.get(hd.month, str(hd.month))
+            return f"{hd.day} {month}, {hd.year}"
+        except Exception:
+            pass
+    return _hebrew_date_arithmetic(jd)
 
 
 # ---------------------------------------------------------------------------
@@ -356,6 +506,19 @@ def _get_parsha_date(parsha: str, heb_year: int, diaspora: bool = True) -> _dt.d
     return _PARSHA_SCHEDULE_CACHE[key].get(parsha)
 
 
+def _reverse_parsha_map(heb_year: int) -> Dict[_dt.date, str]:
+    """Return ``{date: parsha}`` for the readings of Hebrew *heb_year*.
+
+    Only the Diaspora schedule is implemented.  Returns an empty dict if
+    the schedule cannot be computed.
+    """
+    schedule_fn = _hc_parsha_schedule if _HC_AVAILABLE else _get_parsha_schedule_diaspora
+    try:
+        return {d: parsha for parsha, d in schedule_fn(heb_year).items()}
+    except Exception:
+        return {}
+
+
 # ---------------------------------------------------------------------------
 # Data: Torah options, Maftir options, Haftarah options – loaded from XML
 # ---------------------------------------------------------------------------
@@ -365,113 +528,114 @@ def _get_parsha_date(parsha: str, heb_year: int, diaspora: bool = True) -> _dt.d
 import os as _os
 import xml.etree.ElementTree as _ET
 
-# Structure: {parsha_name: {"torah": [...], "maftir": [...], "haftarah": [...]}}
-_SEDROT_OPTIONS: Dict[str, Dict[str, List[str]]] = {}
+
+class _SedraOpts(NamedTuple):
+    """Torah/Maftir/Haftarah option names for one reading in sedrot.xml.
+
+    The plain fields hold the regular Shabbat options; the ``all_*``
+    fields include every SPECIAL variant and are used for holidays.
+    """
+
+    torah: Tuple[str, ...]
+    maftir: Tuple[str, ...]
+    haftarah: Tuple[str, ...]
+    all_torah: Tuple[str, ...]
+    all_maftir: Tuple[str, ...]
+    all_haftarah: Tuple[str, ...]
+
+
+# Structure: {parsha_name: _SedraOpts(torah=(...), maftir=(...), ...)}
+_SEDROT_OPTIONS: Dict[str, _SedraOpts] = {}
+
+
+# Directory of this module, used to locate the bundled XML data files.
+_MOD_DIR = _os.path.dirname(_os.path.abspath(__file__))
+
+_SEDROT_CANDIDATES: Tuple[str, ...] = (
+    # Same directory as this module
+    _os.path.join(_MOD_DIR, "sedrot.xml"),
+    # One level up
+    _os.path.join(_MOD_DIR, "..", "sedrot.xml"),
+    # Two levels up
+    _os.path.join(_MOD_DIR, "..", "..", "sedrot.xml"),
+    # Working directory
+    "sedrot.xml",
+    # Uploads path (development / testing)
+    "/mnt/user-data/uploads/sedrot.xml",
+)
 
 
 def _find_sedrot_xml() -> str | None:
     """Search for sedrot.xml in common locations relative to this file."""
-    candidates = [
-        # Same directory as this module
-        _os.path.join(_os.path.dirname(_os.path.abspath(__file__)), "sedrot.xml"),
-        # One level up
-        _os.path.join(_os.path.dirname(_os.path.abspath(__file__)), "..", "sedrot.xml"),
-        # Two levels up
-        _os.path.join(_os.path.dirname(_os.path.abspath(__file__)), "..", "..", "sedrot.xml"),
-        # Working directory
-        "sedrot.xml",
-        # Uploads path (development / testing)
-        "/mnt/user-data/uploads/sedrot.xml",
-    ]
-    for path in candidates:
-        if _os.path.isfile(path):
-            return path
-    return None
-
+    return next((p for p in _SEDROT_CANDIDATES if _os.path.isfile(p)), None)
+
+
+# OPTION TYPE → (field receiving every option, field receiving regular
+# options or None, accepted CYCLE values or None).  A CYCLE filter also
+# drops SPECIAL overlays (Shabbat Rosh Chodesh, Chanukah, etc.); without
+# one, SPECIAL options are kept since the user must choose between them
+# (e.g. Pinchas before/after 17th of Tammuz, Haazinu between RH and YK).
+_SEDROT_DISPATCH: Dict[str, Tuple[str, Optional[str], Optional[Tuple[int, ...]]]] = {
+    # Torah options: CYCLE 0 = regular Shabbas, CYCLE 4 = Weekday
+    "Torah":     ("all_torah", "torah", (0, 4)),
+    "HiHoliday": ("all_torah", "torah", (0, 4)),
+    # Megilla-type options are the "Torah" reading for Megillot
+    "Esther":                    ("all_torah", None, None),
+    "Ruth-Koheles-ShirHashirim": ("all_torah", None, None),
+    "Eichah":                    ("all_torah", None, None),
+    "Tehillim":                  ("all_torah", None, None),
+    # Maftir options: CYCLE 0 = regular
+    "Maftir":   ("all_maftir", "maftir", (0,)),
+    "Haftarah": ("all_haftarah", "haftarah", None),
+}
 
-def _load_sedrot_xml() -> None:
-    """Parse sedrot.xml and populate _SEDROT_OPTIONS."""
-    global _SEDROT_OPTIONS
-    path = _find_sedrot_xml()
-    if not path:
-        return  # Fallback to empty – callers will use defaults
 
-    try:
-        tree = _ET.parse(path)
-        root = tree.getroot()
-    except Exception:
-        return
+def _parse_sedrot_xml(path: str) -> Dict[str, _SedraOpts]:
+    """Parse sedrot.xml at *path* and return the per-reading options."""
+    options: Dict[str, _SedraOpts] = {}
 
-    for reading in root.findall("READING"):
+    for _, reading in _ET.iterparse(path, events=("end",)):
+        if reading.tag != "READING":
+            continue
         name = reading.get("NAME", "")
-        torah_opts: List[str] = []
-        maftir_opts: List[str] = []
-        haftarah_opts: List[str] = []
-        # For holidays: ALL Torah options (including SPECIAL) are shown
-        all_torah_opts: List[str] = []
-        all_maftir_opts: List[str] = []
-        all_haftarah_opts: List[str] = []
+        # Insertion-ordered dicts double as de-duplicating option lists
+        buckets: Dict[str, Dict[str, None]] = {f: {} for f in _SedraOpts._fields}
 
         for child in reading:
-            opt_type = child.get("TYPE", "")
-            opt_name = child.get("NAME", "")
-            special = child.get("SPECIAL", "")
-            cycle_str = child.get("CYCLE", "")
-
-            # Torah options: CYCLE 0 = regular Shabbas, CYCLE 4 = Weekday
-            # Skip SPECIAL overlays (Shabbat Rosh Chodesh, Chanukah, etc.)
-            if opt_type in ("Torah", "HiHoliday") and opt_name:
-                # All Torah options (for holidays, no filter)
-                if opt_name not in all_torah_opts:
-                    all_torah_opts.append(opt_name)
-                if special:
+            attrib = child.attrib
+            entry = _SEDROT_DISPATCH.get(attrib.get("TYPE", ""))
+            opt_name = attrib.get("NAME", "")
+            if entry is None or not opt_name:
+                continue
+            all_field, field, cycles = entry
+            buckets[all_field][opt_name] = None
+            if field is None:
+                continue
+            if cycles is not None:
+                if attrib.get("SPECIAL"):
                     continue
-                try:
-                    cycle = int(cycle_str)
-                except ValueError:
-                    cycle = -1
-                if cycle in (0, 4) and opt_name not in torah_opts:
-                    torah_opts.append(opt_name)
-
-            # Megilla-type options: Esther, Ruth/Koheles/ShirHashirim, Eichah
-            # These are the "Torah" reading for Megillot – store in all_torah
-            elif opt_type in ("Esther", "Ruth-Koheles-ShirHashirim", "Eichah",
-                              "Tehillim") and opt_name:
-                if opt_name not in all_torah_opts:
-                    all_torah_opts.append(opt_name)
-
-            # Maftir options: CYCLE 0 = regular, skip SPECIAL overlays
-            elif opt_type == "Maftir" and opt_name:
-                if opt_name not in all_maftir_opts:
-                    all_maftir_opts.append(opt_name)
-                if special:
+                cycle_str = attrib.get("CYCLE", "")
+                cycle = int(cycle_str) if cycle_str.isdecimal() else -1
+                if cycle not in cycles:
                     continue
-                try:
-                    cycle = int(cycle_str)
-                except ValueError:
-                    cycle = -1
-                if cycle == 0 and opt_name not in maftir_opts:
-                    maftir_opts.append(opt_name)
-
-            # Haftarah options: include ALL options including SPECIAL,
-            # since the user must choose between them (e.g. Pinchas
-            # before/after 17th of Tammuz, Haazinu between RH and YK)
-            elif opt_type == "Haftarah" and opt_name:
-                if opt_name not in haftarah_opts:
-                    haftarah_opts.append(opt_name)
-                if opt_name not in all_haftarah_opts:
-                    all_haftarah_opts.append(opt_name)
+            buckets[field][opt_name] = None
 
         if name:
-            _SEDROT_OPTIONS[name] = {
-                "torah": torah_opts,
-                "maftir": maftir_opts,
-                "haftarah": haftarah_opts,
-                # Full lists for holidays (include all SPECIAL variants)
-                "all_torah": all_torah_opts,
-                "all_maftir": all_maftir_opts,
-                "all_haftarah": all_haftarah_opts,
-            }
+            options[name] = _SedraOpts(
+                *(tuple(buckets[f]) for f in _SedraOpts._fields))
+        reading.clear()  # Release the processed subtree
+    return options
+
+
+def _load_sedrot_xml() -> None:
+    """Parse sedrot.xml and populate _SEDROT_OPTIONS."""
+    path = _find_sedrot_xml()
+    if not path:
+        return  # Fallback to empty – callers will use defaults
+    try:
+        _SEDROT_OPTIONS.update(_parse_sedrot_xml(path))
+    except Exception:
+        pass  # Unreadable file – callers will use defaults
 
 
 # Load on import
@@ -517,19 +681,18 @@ _STANDALONE_MEGILLA_TYPE: Dict[str, str] = {
 }
 
 
+_MEGILLOT_CANDIDATES: Tuple[str, ...] = (
+    _os.path.join(_MOD_DIR, "tropedef_megillot.xml"),
+    _os.path.join(_MOD_DIR, "..", "tropedef_megillot.xml"),
+    _os.path.join(_MOD_DIR, "..", "..", "tropedef_megillot.xml"),
+    "tropedef_megillot.xml",
+    "/mnt/user-data/uploads/tropedef_megillot.xml",
+)
+
+
 def _find_megillot_xml() -> str | None:
     """Search for tropedef_megillot.xml in common locations."""
-    candidates = [
-        _os.path.join(_os.path.dirname(_os.path.abspath(__file__)), "tropedef_megillot.xml"),
-        _os.path.join(_os.path.dirname(_os.path.abspath(__file__)), "..", "tropedef_megillot.xml"),
-        _os.path.join(_os.path.dirname(_os.path.abspath(__file__)), "..", "..", "tropedef_megillot.xml"),
-        "tropedef_megillot.xml",
-        "/mnt/user-data/uploads/tropedef_megillot.xml",
-    ]
-    for path in candidates:
-        if _os.path.isfile(path):
-            return path
-    return None
+    return next((p for p in _MEGILLOT_CANDIDATES if _os.path.isfile(p)), None)
 
 
 def _load_megillot_xml() -> None:
@@ -570,59 +733,71 @@ def _megilla_melody_options(megilla_type: str) -> List[str]:
     return variants if variants else [megilla_type]
 
 
-def _get_torah_options(parsha: str | None) -> List[str]:
+# Fallbacks when a reading has no options in sedrot.xml
+_DEFAULT_TORAH: Tuple[str, ...] = ("Shabbas", "Weekday")
+_DEFAULT_MAFTIR: Tuple[str, ...] = ("Standard",)
+_NO_OPTIONS: Tuple[str, ...] = ()
+
+
+def _get_torah_options(parsha: str | None) -> Sequence[str]:
     """Return the list of Torah options for *parsha* from sedrot.xml."""
-    if parsha and parsha in _SEDROT_OPTIONS:
-        opts = _SEDROT_OPTIONS[parsha]["torah"]
-        if opts:
-            return opts
-    # Fallback
-    return ["Shabbas", "Weekday"]
+    opts = _SEDROT_OPTIONS.get(parsha) if parsha else None
+    return (opts.torah if opts else None) or _DEFAULT_TORAH
 
 
-def _get_maftir_options(parsha: str | None) -> List[str]:
+def _get_maftir_options(parsha: str | None) -> Sequence[str]:
     """Return Maftir options for *parsha* from sedrot.xml."""
-    if parsha and parsha in _SEDROT_OPTIONS:
-        opts = _SEDROT_OPTIONS[parsha]["maftir"]
-        if opts:
-            return opts
-    return ["Standard"]
+    opts = _SEDROT_OPTIONS.get(parsha) if parsha else None
+    return (opts.maftir if opts else None) or _DEFAULT_MAFTIR
 
 
-def _get_haftarah_options(parsha: str | None) -> List[str]:
+def _get_haftarah_options(parsha: str | None) -> Sequence[str]:
     """Return Haftarah options for the given parsha from sedrot.xml."""
-    if parsha and parsha in _SEDROT_OPTIONS:
-        opts = _SEDROT_OPTIONS[parsha]["haftarah"]
-        if opts:
-            return opts
-    return []
+    opts = _SEDROT_OPTIONS.get(parsha) if parsha else None
+    return opts.haftarah if opts else _NO_OPTIONS
 
 
-def _get_holiday_torah_options(holiday: str) -> List[str]:
+def _get_holiday_torah_options(holiday: str) -> Sequence[str]:
     """Return ALL Torah options for a holiday (including all SPECIAL variants)."""
-    if holiday in _SEDROT_OPTIONS:
-        opts = _SEDROT_OPTIONS[holiday].get("all_torah", [])
-        if opts:
-            return opts
-    return []
+    opts = _SEDROT_OPTIONS.get(holiday)
+    return opts.all_torah if opts else _NO_OPTIONS
 
 
-def _get_holiday_maftir_options(holiday: str) -> List[str]:
+def _get_holiday_maftir_options(holiday: str) -> Sequence[str]:
     """Return ALL Maftir options for a holiday."""
-    if holiday in _SEDROT_OPTIONS:
-        opts = _SEDROT_OPTIONS[holiday].get("all_maftir", [])
-        if opts:
-            return opts
-    return []
+    opts = _SEDROT_OPTIONS.get(holiday)
+    return opts.all_maftir if opts else _NO_OPTIONS
 
 
-def _get_holiday_haftarah_options(holiday: str) -> List[str]:
+def _get_holiday_haftarah_options(holiday: str) -> Sequence[str]:
     """Return ALL Haftarah options for a holiday."""
-    if holiday in _SEDROT_OPTIONS:
-        opts = _SEDROT_OPTIONS[holiday].get("all_haftarah", [])
-        if opts:
-            return opts
-    return []
+    opts = _SEDROT_OPTIONS.get(holiday)
+    return opts.all_haftarah if opts else _NO_OPTIONS
+
+
+@lru_cache(maxsize=64)
+def _holiday_torah_with_melodies(holiday: str) -> Tuple[str, ...]:
+    """Return the holiday Torah options with Megilla melody variants spliced in.
+
+    For holidays that have an associated Megilla (Purim, Pesach, Shavuos,
+    Succos, Tisha B'Av) the bare Megilla option name is replaced by the
+    full melody variant list from tropedef_megillot.xml.  Both XML files
+    are loaded at import, so the merged tuple is computed once per holiday.
+    """
+    holiday_torah = list(_get_holiday_torah_options(holiday))
+    megilla_option = _HOLIDAY_MEGILLA_OPTION.get(holiday)
+    if megilla_option:
+        megilla_type = _MEGILLA_OPTION_TYPE.get(megilla_option, "")
+        melody_variants = _megilla_melody_options(megilla_type) if megilla_type else []
+
+        # Remove the bare option name if present, then append melody variants
+        if megilla_option in holiday_torah:
+            idx = holiday_torah.index(megilla_option)
+            holiday_torah[idx:idx + 1] = melody_variants
+        else:
+            # Not yet in the list (Pesach, Shavuos, Tisha B'Av): append
+            holiday_torah.extend(melody_variants)
+    return tuple(holiday_torah)
 
 class _ParshaCalendarWidget(QWidget):
     """Custom calendar widget that shows parsha names on Shabbat days.
@@ -649,6 +824,8 @@ class _ParshaCalendarWidget(QWidget):
         self._diaspora = True
         # Cache: {(year, month): {day: (heb_str, parsha_str, special_str)}}
         self._cell_cache: Dict[tuple, Dict[int, tuple]] = {}
+        # Cache: {(year, month): (month_title, hebrew_month_label)}, bounded
+        self._label_cache: OrderedDict[Tuple[int, int], Tuple[str, str]] = OrderedDict()
         self.setMinimumSize(560, 380)
         self.setSizePolicy(
             self.sizePolicy().horizontalPolicy(),
@@ -706,28 +883,50 @@ class _ParshaCalendarWidget(QWidget):
             except Exception:
                 pass
 
-        for d in range(1, days_in_month + 1):
+        heb_parts = _hebrew_parts_run(QDate(year, month, 1).toJulianDay(), days_in_month)
+        for d, (heb_day, heb_month, _) in enumerate(heb_parts, 1):
             gdate = _dt.date(year, month, d)
             qdate = QDate(year, month, d)
-            heb_str = _gregorian_to_hebrew_approx(qdate)
-            heb_label = ""
-            if heb_str:
-                parts = heb_str.split(",")
-                if parts:
-                    heb_label = parts[0].strip()
+            heb_label = f"{heb_day} {heb_month}"
             parsha_label = ""
             if qdate.dayOfWeek() == 6:
                 parsha_label = greg_to_parsha.get(gdate, "")
-            special_label = ""
-            if heb_label:
-                dp = heb_label.split(" ")[0]
-                if dp in ("1", "30"):
-                    special_label = "Rosh Chodesh"
+            special_label = "Rosh Chodesh" if heb_day in (1, 30) else ""
             result[d] = (heb_label, parsha_label, special_label)
 
         self._cell_cache[key] = result
         return result
 
+    def _header_labels(self, year: int, month: int) -> Tuple[str, str]:
+        """Return (month title, Hebrew month label) for the header.
+
+        Labels are cached per month so repaints and page flicks do not
+        recompute and re-parse the Hebrew date.
+        """
+        key = (year, month)
+        cached = self._label_cache.get(key)
+        if cached is not None:
+            return cached
+
+        month_name = QDate(year, month, 1).toString("MMMM yyyy")
+        # Hebrew month label for header: accurate via hebrew_calendar module
+        if _HC_AVAILABLE:
+            try:
+                heb_month_label = _hc_header(year, month)
+            except Exception:
+                heb_month_label = ""
+        else:
+            # Same converter as the legacy cells, so month names agree
+            _, heb_month, heb_year = _hebrew_parts_arithmetic(
+                QDate(year, month, 15).toJulianDay())
+            heb_month_label = f"{heb_month} {heb_year}"
+
+        labels = (month_name, heb_month_label)
+        self._label_cache[key] = labels
+        if len(self._label_cache) > 128:
+            self._label_cache.popitem(last=False)
+        return labels
+
     def _nav_rects(self) -> tuple:
         """Return (prev_rect, next_rect) for navigation arrows."""
         w = self.width()
@@ -777,24 +976,8 @@ class _ParshaCalendarWidget(QWidget):
             )
 
         # Month/year text
-        month_name = QDate(self._view_year, self._view_month, 1).toString("MMMM yyyy")
-        # Hebrew month label for header: accurate via hebrew_calendar module
-        if _HC_AVAILABLE:
-            try:
-                heb_month_label = _hc_header(self._view_year, self._view_month)
-            except Exception:
-                heb_month_label = ""
-        else:
-            heb_mid = _gregorian_to_hebrew_approx(
-                QDate(self._view_year, self._view_month, 15))
-            heb_month_label = ""
-            if heb_mid:
-                parts = heb_mid.split(",")
-                if len(parts) >= 2:
-                    month_part = parts[0].strip().split(" ")
-                    year_part = parts[-1].strip()
-                    if len(month_part) >= 2:
-                        heb_month_label = f"{month_part[1]} {year_part}"
+        month_name, heb_month_label = self._header_labels(
+            self._view_year, self._view_month)
 
         painter.setPen(QPen(QColor("white")))
         title_font = QF("Arial", 12, QF.Weight.Bold)
@@ -1090,6 +1273,70 @@ class CalendarDialog(QDialog):
         return self._selected
 
 
+# ---------------------------------------------------------------------------
+# Custom readings table model
+# ---------------------------------------------------------------------------
+
+class _AliyotModel(QAbstractTableModel):
+    """Read-only model behind the Custom readings aliyot table.
+
+    Each row holds an aliyah name; references are stored only once one
+    has been set through the row's Edit button.  The last column carries
+    no data and hosts the row's Edit/Clear buttons.
+    """
+
+    _HEADERS = ("Reading", "Reference", "")
+    # Every cell shares the same read-only flags
+    _FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def __init__(self, aliyot_names: Sequence[str], parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._names: Tuple[str, ...] = tuple(aliyot_names)
+        # Row → reference, filled by set_reference when an edit is accepted
+        self._refs: Dict[int, str] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if index.column() == 0:
+            return self._names[index.row()]
+        if index.column() == 1:
+            return self._refs.get(index.row())
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.DisplayRole
+                and orientation == Qt.Orientation.Horizontal):
+            return self._HEADERS[section]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        return self._FLAGS
+
+    def aliyah_name(self, row: int) -> str:
+        """Return the aliyah name shown in *row*."""
+        return self._names[row]
+
+    def set_reference(self, row: int, reference: str) -> None:
+        """Show *reference* for the aliyah in *row*."""
+        self._refs[row] = reference
+        index = self.index(row, 1)
+        self.dataChanged.emit(index, index)
+
+    def clear_reference(self, row: int) -> None:
+        """Remove the reference shown for the aliyah in *row*."""
+        if self._refs.pop(row, None) is not None:
+            index = self.index(row, 1)
+            self.dataChanged.emit(index, index)
+
+
 # ---------------------------------------------------------------------------
 # Custom reading edit sub‑dialog
 # ---------------------------------------------------------------------------
@@ -1171,6 +1418,159 @@ class CustomReadingEditDialog(QDialog):
         layout.addLayout(btn_layout)
         self.setLayout(layout)
 
+    def reference(self) -> str:
+        """Return the entered range, e.g. ``"Genesis 1:1-2:3"``.
+
+        The book is left out while the combo still shows its prompt.
+        """
+        span = (f"{self.start_chapter_spin.value()}:{self.start_verse_spin.value()}"
+                f"-{self.to_chapter_spin.value()}:{self.to_verse_spin.value()}")
+        if self.book_combo.currentIndex() > 0:
+            return f"{self.book_combo.currentText()} {span}"
+        return span
+
+
+# ---------------------------------------------------------------------------
+# Parsha data
+# ---------------------------------------------------------------------------
+# Book names are interned so every (parsha, book) entry – and every radio
+# button tagged from it – shares one string object per book, and parsha
+# comparisons against button attributes reduce to identity checks.
+
+_BOOKS: Dict[str, str] = {
+    b: sys.intern(b)
+    for b in (
+        "Bereshit/Genesis",
+        "Shemot/Exodus",
+        "Vayikra/Leviticus",
+        "Bamidbar/Numbers",
+        "Devarim/Deuteronomy",
+    )
+}
+
+# Combined parshiot (e.g. Vayakhel+Pekudei) are included to match the
+# original TropeTrainer.
+_ALL_PARSHIOT: Tuple[Tuple[str, str], ...] = tuple(
+    (sys.intern(p), _BOOKS[b]) for p, b in (
+        # Bereishis / Genesis
+        ("Bereishis", "Bereshit/Genesis"),
+        ("Noach", "Bereshit/Genesis"),
+        ("Lech Lecha", "Bereshit/Genesis"),
+        ("Vayeira", "Bereshit/Genesis"),
+        ("Chayei Sarah", "Bereshit/Genesis"),
+        ("Toldos", "Bereshit/Genesis"),
+        ("Vayeitzei", "Bereshit/Genesis"),
+        ("Vayishlach", "Bereshit/Genesis"),
+        ("Vayeishev", "Bereshit/Genesis"),
+        ("Mikeitz", "Bereshit/Genesis"),
+        ("Vayigash", "Bereshit/Genesis"),
+        ("Vayechi", "Bereshit/Genesis"),
+        # Shemos / Exodus
+        ("Shemos", "Shemot/Exodus"),
+        ("Va'eira", "Shemot/Exodus"),
+        ("Bo", "Shemot/Exodus"),
+        ("Beshalach", "Shemot/Exodus"),
+        ("Yisro", "Shemot/Exodus"),
+        ("Mishpatim", "Shemot/Exodus"),
+        ("Terumah", "Shemot/Exodus"),
+        ("Tetzaveh", "Shemot/Exodus"),
+        ("Ki Sisa", "Shemot/Exodus"),
+        ("Vayakhel", "Shemot/Exodus"),
+        ("Vayakhel+Pekudei", "Shemot/Exodus"),
+        ("Pekudei", "Shemot/Exodus"),
+        # Vayikra / Leviticus
+        ("Vayikra", "Vayikra/Leviticus"),
+        ("Tzav", "Vayikra/Leviticus"),
+        ("Shemini", "Vayikra/Leviticus"),
+        ("Tazria", "Vayikra/Leviticus"),
+        ("Tazria+Metzora", "Vayikra/Leviticus"),
+        ("Metzora", "Vayikra/Leviticus"),
+        ("Acharei", "Vayikra/Leviticus"),
+        ("Acharei+Kedoshim", "Vayikra/Leviticus"),
+        ("Kedoshim", "Vayikra/Leviticus"),
+        ("Emor", "Vayikra/Leviticus"),
+        ("Behar", "Vayikra/Leviticus"),
+        ("Behar+Bechukosai", "Vayikra/Leviticus"),
+        ("Bechukosai", "Vayikra/Leviticus"),
+        # Bamidbar / Numbers
+        ("Bamidbar", "Bamidbar/Numbers"),
+        ("Nasso", "Bamidbar/Numbers"),
+        ("Beha'aloscha", "Bamidbar/Numbers"),
+        ("Shelach", "Bamidbar/Numbers"),
+        ("Korach", "Bamidbar/Numbers"),
+        ("Chukas", "Bamidbar/Numbers"),
+        ("Chukas+Balak", "Bamidbar/Numbers"),
+        ("Balak", "Bamidbar/Numbers"),
+        ("Pinchas", "Bamidbar/Numbers"),
+        ("Mattos", "Bamidbar/Numbers"),
+        ("Mattos+Masei", "Bamidbar/Numbers"),
+        ("Masei", "Bamidbar/Numbers"),
+        # Devarim / Deuteronomy
+        ("Devarim", "Devarim/Deuteronomy"),
+        ("Va'Eschanan", "Devarim/Deuteronomy"),
+        ("Eikev", "Devarim/Deuteronomy"),
+        ("Re'eh", "Devarim/Deuteronomy"),
+        ("Shoftim", "Devarim/Deuteronomy"),
+        ("Ki Seitzei", "Devarim/Deuteronomy"),
+        ("Ki Savo", "Devarim/Deuteronomy"),
+        ("Nitzavim", "Devarim/Deuteronomy"),
+        ("Nitzavim+Vayeilech", "Devarim/Deuteronomy"),
+        ("Vayeilech", "Devarim/Deuteronomy"),
+        ("Haazinu", "Devarim/Deuteronomy"),
+        ("V'zos HaBracha", "Devarim/Deuteronomy"),
+    )
+)
+
+# Column headers for the Shabbat tab, keyed by book in column order.
+_BOOK_HEADERS: Dict[str, str] = {
+    "Bereshit/Genesis": "Bereishis/Genesis",
+    "Shemot/Exodus": "Shemos/Exodus",
+    "Vayikra/Leviticus": "Vayikra/Leviticus",
+    "Bamidbar/Numbers": "Bamidbar/Numbers",
+    "Devarim/Deuteronomy": "Devarim/Deuteronomy",
+}
+
+
+def _parsha_grid_positions() -> Tuple[Tuple[int, int], ...]:
+    """Return the Shabbat-tab ``(row, col)`` cell for each _ALL_PARSHIOT entry.
+
+    Each book is one column under its header in row 0; parshiot fill the
+    rows below it in Torah order.
+    """
+    book_cols = {book: col for col, book in enumerate(_BOOK_HEADERS)}
+    next_row = [1] * len(book_cols)
+    cells: List[Tuple[int, int]] = []
+    for _, book in _ALL_PARSHIOT:
+        col = book_cols[book]
+        cells.append((next_row[col], col))
+        next_row[col] += 1
+    return tuple(cells)
+
+
+# Grid cells for the Shabbat tab, parallel to _ALL_PARSHIOT.
+_PARSHA_GRID: Tuple[Tuple[int, int], ...] = _parsha_grid_positions()
+
+# Holiday tab layout, matching the original TropeTrainer exactly.
+# Left column: main holidays  Right column: other holidays + megillot
+_LEFT_HOLIDAYS: Tuple[str, ...] = (
+    "Rosh Chodesh", "Rosh Hashanah", "Fast of Gedalia",
+    "Yom Kippur", "Succos", "Hoshana Rabbah",
+    "Shemini Atzeres", "Simchas Torah", "Chanukah",
+    "Tenth of Teves", "Fast of Esther",
+)
+_RIGHT_HOLIDAYS: Tuple[str, ...] = (
+    "Purim", "Pesach", "Shavuos",
+    "Seventeenth of Tammuz", "Tisha B'Av",
+)
+_MEGILLOT: Tuple[str, ...] = tuple(_STANDALONE_MEGILLA_TYPE)
+
+
+@lru_cache(maxsize=512)
+def _year_labels(heb_year: int) -> Tuple[str, str]:
+    """Return the Gregorian-range and cycle label texts for a Hebrew year."""
+    greg = heb_year - 3760
+    return f"({greg}/{greg + 1})", f"Cycle for {heb_year}:"
+
 
 # ---------------------------------------------------------------------------
 # Main Open Reading Dialog
@@ -1202,6 +1602,31 @@ class OpenReadingDialog(QDialog):
         self.selected_date: QDate = QDate.currentDate()
         self.cycle: int = 0
         self.diaspora: bool = True
+        # Parsha whose options are currently shown in the option lists
+        self._last_parsha: str | None = None
+        # Parsha radio clicks are coalesced: only the last selection in a
+        # burst (e.g. arrowing through the list) refreshes the option lists
+        self._pending_parsha: str | None = None
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(30)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        # Shabbat date → parsha for the Hebrew years in _date_index_years,
+        # built on the first calendar lookup
+        self._date_to_parsha: Dict[_dt.date, str] = {}
+        self._date_index_years: Tuple[int, ...] = ()
+        # Tab index → accept handler, used by _accept_selection
+        self._tab_accept = {
+            0: self._accept_shabbat,
+            1: self._accept_holiday,
+            2: self._accept_custom,
+        }
+        # Tab index → builder for tabs whose contents are deferred until
+        # first shown; entries are removed once built
+        self._tab_builders = {
+            1: self._build_holiday_tab_contents,
+            2: self._build_custom_tab_contents,
+        }
         self._init_ui()
 
     # ------------------------------------------------------------------ #
@@ -1252,6 +1677,7 @@ class OpenReadingDialog(QDialog):
         self._create_shabbat_tab()
         self._create_holiday_tab()
         self._create_custom_tab()
+        self.main_tabs.currentChanged.connect(self._ensure_tab_built)
 
         # ---- Year / location / triennial bar ----
         year_bar = QHBoxLayout()
@@ -1264,8 +1690,8 @@ class OpenReadingDialog(QDialog):
         self.year_spinbox.setFixedWidth(70)
         year_bar.addWidget(self.year_spinbox)
 
-        greg = QDate.currentDate().year()
-        self.greg_range_label = QLabel(f"({greg}/{greg + 1})")
+        greg_range, cycle_text = _year_labels(current_heb_year)
+        self.greg_range_label = QLabel(greg_range)
         year_bar.addWidget(self.greg_range_label)
 
         year_bar.addSpacing(10)
@@ -1286,7 +1712,7 @@ class OpenReadingDialog(QDialog):
         self.triennial_checkbox = QCheckBox("Use triennial Torah cycle")
         year_bar.addWidget(self.triennial_checkbox)
 
-        self.cycle_label = QLabel(f"Cycle for {current_heb_year}:")
+        self.cycle_label = QLabel(cycle_text)
         year_bar.addWidget(self.cycle_label)
         self.cycle_spinbox = QSpinBox()
         self.cycle_spinbox.setRange(1, 3)
@@ -1390,46 +1816,22 @@ class OpenReadingDialog(QDialog):
         self.parsha_button_group = QButtonGroup(self)
         self.parsha_button_group.buttonClicked.connect(self._on_parsha_selected)
 
-        parshiot = self._get_all_parshiot()
-
         # Organise into 5 columns by book
-        books_order = [
-            "Bereshit/Genesis",
-            "Shemot/Exodus",
-            "Vayikra/Leviticus",
-            "Bamidbar/Numbers",
-            "Devarim/Deuteronomy",
-        ]
-        book_short = {
-            "Bereshit/Genesis": "Bereishis/Genesis",
-            "Shemot/Exodus": "Shemos/Exodus",
-            "Vayikra/Leviticus": "Vayikra/Leviticus",
-            "Bamidbar/Numbers": "Bamidbar/Numbers",
-            "Devarim/Deuteronomy": "Devarim/Deuteronomy",
-        }
+        for col, label_text in enumerate(_BOOK_HEADERS.values()):
+            grid.addWidget(QLabel(f"<b>{label_text}</b>"), 0, col)
 
-        # Group parshiot by book
-        book_groups: Dict[str, List[Tuple[str, str]]] = {}
-        for p, b in parshiot:
-            book_groups.setdefault(b, []).append((p, b))
-
-        for col, book_key in enumerate(books_order):
-            entries = book_groups.get(book_key, [])
-            label_text = book_short.get(book_key, book_key)
-            header = QLabel(f"<b>{label_text}</b>")
-            header.setStyleSheet("color: #333; padding: 2px 0;")
-            grid.addWidget(header, 0, col)
-
-            for row_idx, (parsha, book) in enumerate(entries):
-                radio = QRadioButton(parsha)
-                radio.setStyleSheet("QRadioButton { spacing: 2px; }")
-                # Store data on the radio button for retrieval
-                radio.parsha_name = parsha  # type: ignore[attr-defined]
-                radio.book_name = book  # type: ignore[attr-defined]
-                self.parsha_button_group.addButton(radio)
-                grid.addWidget(radio, row_idx + 1, col)
+        # Each radio's button-group id indexes _ALL_PARSHIOT, so the checked
+        # parsha and its book are found without scanning or properties
+        for i, ((parsha, _), (row, col)) in enumerate(
+                zip(_ALL_PARSHIOT, _PARSHA_GRID)):
+            radio = QRadioButton(parsha)
+            self.parsha_button_group.addButton(radio, i)
+            grid.addWidget(radio, row, col)
 
         scroll_widget.setLayout(grid)
+        # One stylesheet for the whole grid instead of one per widget
+        scroll_widget.setStyleSheet(
+            "QRadioButton { spacing: 2px; } QLabel { color: #333; padding: 2px 0; }")
         scroll.setWidget(scroll_widget)
         layout.addWidget(scroll)
 
@@ -1440,13 +1842,21 @@ class OpenReadingDialog(QDialog):
     # Tab: Holiday & special readings
     # ------------------------------------------------------------------ #
     def _create_holiday_tab(self) -> None:
-        """Build the Holiday & special readings tab.
+        """Add the Holiday & special readings tab as an empty placeholder.
+
+        Its ~20 radio buttons are built by :meth:`_ensure_tab_built` the
+        first time the tab is shown.
+        """
+        self._holiday_tab = QWidget()
+        self.main_tabs.addTab(self._holiday_tab, "Holiday & special readings")
+
+    def _build_holiday_tab_contents(self) -> None:
+        """Populate the Holiday & special readings placeholder tab.
 
         The holiday list and their Torah/Maftir/Haftarah options are loaded
         directly from sedrot.xml so that selecting a holiday updates the
         three option lists at the bottom exactly as in the original.
         """
-        tab = QWidget()
         layout = QVBoxLayout()
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -1457,49 +1867,41 @@ class OpenReadingDialog(QDialog):
         self.holiday_button_group = QButtonGroup(self)
         self.holiday_button_group.buttonClicked.connect(self._on_holiday_selected)
 
-        # Fixed two-column layout matching the original TropeTrainer exactly.
-        # Left column: main holidays  Right column: other holidays + megillot
-        left_holidays = [
-            "Rosh Chodesh", "Rosh Hashanah", "Fast of Gedalia",
-            "Yom Kippur", "Succos", "Hoshana Rabbah",
-            "Shemini Atzeres", "Simchas Torah", "Chanukah",
-            "Tenth of Teves", "Fast of Esther",
-        ]
-        right_holidays = [
-            "Purim", "Pesach", "Shavuos",
-            "Seventeenth of Tammuz", "Tisha B'Av",
-        ]
-        megillot = [
-            "Megillas Esther",
-            "Megillas Shir HaShirim (Song of Songs)",
-            "Megillas Ruth",
-            "Megillas Eichah (Lamentations)",
-            "Megillas Koheles (Ecclesiastes)",
-        ]
-
-        for row, h in enumerate(left_holidays):
-            radio = QRadioButton(h)
-            self.holiday_button_group.addButton(radio)
+        # Fixed two-column layout: see _LEFT_HOLIDAYS / _RIGHT_HOLIDAYS
+        for row, h in enumerate(_LEFT_HOLIDAYS):
+            radio = self._make_holiday_radio(h)
             holiday_grid.addWidget(radio, row, 0)
 
-        for row, h in enumerate(right_holidays):
-            radio = QRadioButton(h)
-            self.holiday_button_group.addButton(radio)
+        for row, h in enumerate(_RIGHT_HOLIDAYS):
+            radio = self._make_holiday_radio(h)
             holiday_grid.addWidget(radio, row, 1)
 
         # Megillot: grayed out (dimmed) to match original, but still selectable
-        offset = len(right_holidays) + 1
-        for row, m in enumerate(megillot):
-            radio = QRadioButton(m)
-            radio.setStyleSheet("color: gray;")
-            self.holiday_button_group.addButton(radio)
+        offset = len(_RIGHT_HOLIDAYS) + 1
+        for row, m in enumerate(_MEGILLOT):
+            radio = self._make_holiday_radio(m)
+            radio.setObjectName("megilla")
             holiday_grid.addWidget(radio, offset + row, 1)
 
         scroll_widget.setLayout(holiday_grid)
+        scroll_widget.setStyleSheet("QRadioButton#megilla { color: gray; }")
         scroll.setWidget(scroll_widget)
         layout.addWidget(scroll)
-        tab.setLayout(layout)
-        self.main_tabs.addTab(tab, "Holiday & special readings")
+        self._holiday_tab.setLayout(layout)
+
+    def _make_holiday_radio(self, holiday: str) -> QRadioButton:
+        """Create a holiday radio button tagged with its accept values.
+
+        The ``reading_type`` property is the Megilla type for standalone
+        Megilla buttons (so main_window can look up the right book and
+        verse numbering) and ``None`` for regular holidays.
+        """
+        radio = QRadioButton(holiday)
+        radio.setProperty("parsha", holiday)
+        radio.setProperty("book", "Holiday")
+        radio.setProperty("reading_type", _STANDALONE_MEGILLA_TYPE.get(holiday))
+        self.holiday_button_group.addButton(radio)
+        return radio
 
     # ------------------------------------------------------------------ #
     # Signal handler: holiday selected
@@ -1507,6 +1909,10 @@ class OpenReadingDialog(QDialog):
     def _on_holiday_selected(self, button: QRadioButton) -> None:
         """Update option lists when the user selects a holiday."""
         holiday = button.text()
+        # Drop a parsha refresh still queued, or it would overwrite the
+        # holiday's options when the timer fires
+        self._refresh_timer.stop()
+        self._pending_parsha = None
         self._refresh_option_lists_holiday(holiday)
 
     def _refresh_option_lists_holiday(self, holiday: str) -> None:
@@ -1518,6 +1924,8 @@ class OpenReadingDialog(QDialog):
         variants from tropedef_megillot.xml.
         For standalone Megilla buttons: only the melody variants are shown.
         """
+        # The lists no longer show any parsha's options
+        self._last_parsha = None
         self.torah_list.clear()
         self.maftir_list.clear()
         self.haftarah_list.clear()
@@ -1525,8 +1933,7 @@ class OpenReadingDialog(QDialog):
         # ---- Standalone Megilla buttons (grayed out in right column) ----
         if holiday in _STANDALONE_MEGILLA_TYPE:
             megilla_type = _STANDALONE_MEGILLA_TYPE[holiday]
-            for melody in _megilla_melody_options(megilla_type):
-                self.torah_list.addItem(QListWidgetItem(melody))
+            self.torah_list.addItems(_megilla_melody_options(megilla_type))
             if self.torah_list.count():
                 self.torah_list.setCurrentRow(0)
             self.open_haftarah_btn.setEnabled(False)
@@ -1537,48 +1944,32 @@ class OpenReadingDialog(QDialog):
             self.open_haftarah_btn.setEnabled(False)
             return
 
-        holiday_torah = list(_get_holiday_torah_options(holiday))
+        holiday_torah = _holiday_torah_with_melodies(holiday)
         holiday_maftir = _get_holiday_maftir_options(holiday)
         holiday_haftarah = _get_holiday_haftarah_options(holiday)
-
-        # For holidays that have an associated Megilla (Purim, Pesach, Shavuos,
-        # Succos, Tisha B'Av): replace the bare Megilla option name with the
-        # full melody variant list from tropedef_megillot.xml.
-        megilla_option = _HOLIDAY_MEGILLA_OPTION.get(holiday)
-        if megilla_option:
-            megilla_type = _MEGILLA_OPTION_TYPE.get(megilla_option, "")
-            melody_variants = _megilla_melody_options(megilla_type) if megilla_type else []
-
-            # Remove the bare option name if present, then append melody variants
-            if megilla_option in holiday_torah:
-                idx = holiday_torah.index(megilla_option)
-                holiday_torah[idx:idx + 1] = melody_variants
-            else:
-                # Not yet in the list (Pesach, Shavuos, Tisha B'Av): append
-                holiday_torah.extend(melody_variants)
-
-        for opt in holiday_torah:
-            self.torah_list.addItem(QListWidgetItem(opt))
-        if self.torah_list.count():
-            self.torah_list.setCurrentRow(0)
-
-        for opt in holiday_maftir:
-            self.maftir_list.addItem(QListWidgetItem(opt))
-        if self.maftir_list.count():
-            self.maftir_list.setCurrentRow(0)
-
-        for opt in holiday_haftarah:
-            self.haftarah_list.addItem(QListWidgetItem(opt))
-        if self.haftarah_list.count():
-            self.haftarah_list.setCurrentRow(0)
-
+        self._fill_option_lists(holiday_torah, holiday_maftir, holiday_haftarah)
         self.open_haftarah_btn.setEnabled(bool(holiday_haftarah))
 
     # ------------------------------------------------------------------ #
     # Tab: Custom readings
     # ------------------------------------------------------------------ #
     def _create_custom_tab(self) -> None:
-        tab = QWidget()
+        """Add the Custom readings tab as an empty placeholder.
+
+        Most sessions never visit this tab, so its table and buttons are
+        only built by :meth:`_ensure_tab_built` when it is first shown.
+        """
+        self._custom_tab = QWidget()
+        self.main_tabs.addTab(self._custom_tab, "Custom readings")
+
+    def _ensure_tab_built(self, index: int) -> None:
+        """Build deferred tab contents the first time *index* is shown."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            builder()
+
+    def _build_custom_tab_contents(self) -> None:
+        """Populate the Custom readings placeholder tab."""
         layout = QVBoxLayout()
 
         # Custom reading name
@@ -1612,14 +2003,12 @@ class OpenReadingDialog(QDialog):
         layout.addLayout(type_row)
 
         # Aliyot table
-        self.custom_table = QTableWidget()
-        aliyot_names = [
+        self.custom_table = QTableView()
+        self.custom_model = _AliyotModel([
             "Kohen", "Levi", "Shlishi", "Revii",
-            "Chamishi", "Shishi", "Sh'vii", "", "Maftir",
-        ]
-        self.custom_table.setRowCount(len(aliyot_names))
-        self.custom_table.setColumnCount(4)
-        self.custom_table.setHorizontalHeaderLabels(["Reading", "Reference", "", ""])
+            "Chamishi", "Shishi", "Sh'vii", "Maftir",
+        ], self.custom_table)
+        self.custom_table.setModel(self.custom_model)
         self.custom_table.horizontalHeader().setStretchLastSection(False)
         self.custom_table.horizontalHeader().setSectionResizeMode(
             0, QHeaderView.ResizeMode.Fixed
@@ -1628,115 +2017,76 @@ class OpenReadingDialog(QDialog):
         self.custom_table.horizontalHeader().setSectionResizeMode(
             1, QHeaderView.ResizeMode.Stretch
         )
+        self.custom_table.horizontalHeader().setSectionResizeMode(
+            2, QHeaderView.ResizeMode.Fixed
+        )
+        self.custom_table.setColumnWidth(2, 110)
         self.custom_table.verticalHeader().setVisible(False)
+        self.custom_table.verticalHeader().setDefaultSectionSize(24)
+        self.custom_table.horizontalHeader().setSectionsClickable(False)
 
-        for i, name in enumerate(aliyot_names):
-            if name == "":
-                self.custom_table.setRowHeight(i, 8)
-                continue
-            name_item = QTableWidgetItem(name)
-            name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.custom_table.setItem(i, 0, name_item)
+        # Add the row buttons with updates suspended so the table
+        # relayouts once instead of after every setIndexWidget.
+        self.custom_table.setUpdatesEnabled(False)
+        try:
+            self._fill_custom_table()
+        finally:
+            self.custom_table.setUpdatesEnabled(True)
+
+        layout.addWidget(self.custom_table)
+        self._custom_tab.setLayout(layout)
 
-            ref_item = QTableWidgetItem("")
-            ref_item.setFlags(ref_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.custom_table.setItem(i, 1, ref_item)
+    def _fill_custom_table(self) -> None:
+        """Create the Edit/Clear buttons for every aliyah row.
+
+        Both buttons share one container widget per row, halving the
+        number of index widgets the view has to track and lay out.
+        """
+        model = self.custom_model
+        for i in range(model.rowCount()):
+            actions = QWidget()
+            actions_layout = QHBoxLayout(actions)
+            actions_layout.setContentsMargins(0, 0, 0, 0)
+            actions_layout.setSpacing(2)
 
             edit_btn = QPushButton("Edit")
             edit_btn.setFixedWidth(50)
-            edit_btn.clicked.connect(
-                lambda checked, n=name: self._edit_custom_reading(n)
-            )
-            self.custom_table.setCellWidget(i, 2, edit_btn)
+            edit_btn.setProperty("aliyah_row", i)
+            edit_btn.clicked.connect(self._edit_custom_reading_from_sender)
+            actions_layout.addWidget(edit_btn)
 
             clear_btn = QPushButton("Clear")
             clear_btn.setFixedWidth(50)
-            self.custom_table.setCellWidget(i, 3, clear_btn)
+            clear_btn.setProperty("aliyah_row", i)
+            clear_btn.clicked.connect(self._clear_custom_reading_from_sender)
+            actions_layout.addWidget(clear_btn)
 
-        layout.addWidget(self.custom_table)
-        tab.setLayout(layout)
-        self.main_tabs.addTab(tab, "Custom readings")
+            self.custom_table.setIndexWidget(model.index(i, 2), actions)
+
+        # Set Maftir apart from the aliyot with a taller row rather than
+        # a blank spacer row
+        last = model.rowCount() - 1
+        self.custom_table.setRowHeight(
+            last, self.custom_table.verticalHeader().defaultSectionSize() + 8)
 
     # ------------------------------------------------------------------ #
     # Parsha data
     # ------------------------------------------------------------------ #
-    def _get_all_parshiot(self) -> List[Tuple[str, str]]:
-        """Return a list of ``(parsha, book)`` tuples for the whole Torah.
+    def _get_all_parshiot(self) -> Tuple[Tuple[str, str], ...]:
+        """Return the ``(parsha, book)`` tuples for the whole Torah.
 
         Combined parshiot (e.g. Vayakhel+Pekudei) are included to match
-        the original TropeTrainer.
+        the original TropeTrainer.  The shared module constant is returned
+        as-is; it is immutable, so no defensive copy is needed.
         """
-        return [
-            # Bereishis / Genesis
-            ("Bereishis", "Bereshit/Genesis"),
-            ("Noach", "Bereshit/Genesis"),
-            ("Lech Lecha", "Bereshit/Genesis"),
-            ("Vayeira", "Bereshit/Genesis"),
-            ("Chayei Sarah", "Bereshit/Genesis"),
-            ("Toldos", "Bereshit/Genesis"),
-            ("Vayeitzei", "Bereshit/Genesis"),
-            ("Vayishlach", "Bereshit/Genesis"),
-            ("Vayeishev", "Bereshit/Genesis"),
-            ("Mikeitz", "Bereshit/Genesis"),
-            ("Vayigash", "Bereshit/Genesis"),
-            ("Vayechi", "Bereshit/Genesis"),
-            # Shemos / Exodus
-            ("Shemos", "Shemot/Exodus"),
-            ("Va'eira", "Shemot/Exodus"),
-            ("Bo", "Shemot/Exodus"),
-            ("Beshalach", "Shemot/Exodus"),
-            ("Yisro", "Shemot/Exodus"),
-            ("Mishpatim", "Shemot/Exodus"),
-            ("Terumah", "Shemot/Exodus"),
-            ("Tetzaveh", "Shemot/Exodus"),
-            ("Ki Sisa", "Shemot/Exodus"),
-            ("Vayakhel", "Shemot/Exodus"),
-            ("Vayakhel+Pekudei", "Shemot/Exodus"),
-            ("Pekudei", "Shemot/Exodus"),
-            # Vayikra / Leviticus
-            ("Vayikra", "Vayikra/Leviticus"),
-            ("Tzav", "Vayikra/Leviticus"),
-            ("Shemini", "Vayikra/Leviticus"),
-            ("Tazria", "Vayikra/Leviticus"),
-            ("Tazria+Metzora", "Vayikra/Leviticus"),
-            ("Metzora", "Vayikra/Leviticus"),
-            ("Acharei", "Vayikra/Leviticus"),
-            ("Acharei+Kedoshim", "Vayikra/Leviticus"),
-            ("Kedoshim", "Vayikra/Leviticus"),
-            ("Emor", "Vayikra/Leviticus"),
-            ("Behar", "Vayikra/Leviticus"),
-            ("Behar+Bechukosai", "Vayikra/Leviticus"),
-            ("Bechukosai", "Vayikra/Leviticus"),
-            # Bamidbar / Numbers
-            ("Bamidbar", "Bamidbar/Numbers"),
-            ("Nasso", "Bamidbar/Numbers"),
-            ("Beha'aloscha", "Bamidbar/Numbers"),
-            ("Shelach", "Bamidbar/Numbers"),
-            ("Korach", "Bamidbar/Numbers"),
-            ("Chukas", "Bamidbar/Numbers"),
-            ("Chukas+Balak", "Bamidbar/Numbers"),
-            ("Balak", "Bamidbar/Numbers"),
-            ("Pinchas", "Bamidbar/Numbers"),
-            ("Mattos", "Bamidbar/Numbers"),
-            ("Mattos+Masei", "Bamidbar/Numbers"),
-            ("Masei", "Bamidbar/Numbers"),
-            # Devarim / Deuteronomy
-            ("Devarim", "Devarim/Deuteronomy"),
-            ("Va'Eschanan", "Devarim/Deuteronomy"),
-            ("Eikev", "Devarim/Deuteronomy"),
-            ("Re'eh", "Devarim/Deuteronomy"),
-            ("Shoftim", "Devarim/Deuteronomy"),
-            ("Ki Seitzei", "Devarim/Deuteronomy"),
-            ("Ki Savo", "Devarim/Deuteronomy"),
-            ("Nitzavim", "Devarim/Deuteronomy"),
-            ("Nitzavim+Vayeilech", "Devarim/Deuteronomy"),
-            ("Vayeilech", "Devarim/Deuteronomy"),
-            ("Haazinu", "Devarim/Deuteronomy"),
-            ("V'zos HaBracha", "Devarim/Deuteronomy"),
-        ]
+        return _ALL_PARSHIOT
+
+    def _parsha_for_button(self, button: QRadioButton) -> Tuple[str, str]:
+        """Return the ``(parsha, book)`` row for a Shabbat-tab radio."""
+        return _ALL_PARSHIOT[self.parsha_button_group.id(button)]
 
     # Provide the legacy method name for backward compatibility
-    def get_all_parshiot(self) -> List[Tuple[str, str]]:
+    def get_all_parshiot(self) -> Tuple[Tuple[str, str], ...]:
         """Backward‑compatible alias for :meth:`_get_all_parshiot`."""
         return self._get_all_parshiot()
 
@@ -1750,71 +2100,103 @@ class OpenReadingDialog(QDialog):
         exactly as in the original TropeTrainer.  The *Open Haftarah*
         button is disabled when no haftarah options are available (e.g.
         V'zos HaBracha).
-        """
-        self.torah_list.clear()
-        for opt in _get_torah_options(parsha):
-            item = QListWidgetItem(opt)
-            self.torah_list.addItem(item)
-        if self.torah_list.count():
-            self.torah_list.setCurrentRow(0)
 
-        self.maftir_list.clear()
-        for opt in _get_maftir_options(parsha):
-            item = QListWidgetItem(opt)
-            self.maftir_list.addItem(item)
-        if self.maftir_list.count():
-            self.maftir_list.setCurrentRow(0)
+        Re-selecting the parsha whose options are already shown is a
+        no-op, so redundant selection signals do not rebuild the lists.
+        """
+        # A direct refresh supersedes any queued one
+        self._refresh_timer.stop()
+        if parsha is not None and parsha == self._last_parsha:
+            return
+        self._last_parsha = parsha
 
-        self.haftarah_list.clear()
         haftarah_opts = _get_haftarah_options(parsha)
-        for opt in haftarah_opts:
-            item = QListWidgetItem(opt)
-            self.haftarah_list.addItem(item)
-        if self.haftarah_list.count():
-            self.haftarah_list.setCurrentRow(0)
+        self._fill_option_lists(
+            _get_torah_options(parsha), _get_maftir_options(parsha), haftarah_opts)
 
         # Enable/disable Open Haftarah based on availability
         has_haftarah = bool(haftarah_opts)
         self.open_haftarah_btn.setEnabled(has_haftarah)
 
+    def _do_refresh(self) -> None:
+        """Apply the parsha selection queued by ``_on_parsha_selected``."""
+        self._refresh_option_lists(self._pending_parsha)
+
+    def _flush_pending_refresh(self) -> None:
+        """Run a queued option-list refresh now, if one is waiting."""
+        if self._refresh_timer.isActive():
+            self._do_refresh()
+
+    def _fill_option_lists(self, torah: Sequence[str], maftir: Sequence[str],
+                           haftarah: Sequence[str]) -> None:
+        """Replace the contents of the three option lists in one pass each.
+
+        ``addItems`` inserts all rows with a single model update, and
+        painting is suspended until every list has been refilled.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            for lst, opts in ((self.torah_list, torah),
+                              (self.maftir_list, maftir),
+                              (self.haftarah_list, haftarah)):
+                lst.clear()
+                lst.addItems(opts)
+                if lst.count():
+                    lst.setCurrentRow(0)
+        finally:
+            self.setUpdatesEnabled(True)
+
     # ------------------------------------------------------------------ #
     # Signal handlers
     # ------------------------------------------------------------------ #
     def _on_parsha_selected(self, button: QRadioButton) -> None:  # type: ignore[override]
         """Update option lists and date header when the user selects a parsha."""
-        parsha = getattr(button, "parsha_name", None)
-        self._refresh_option_lists(parsha)
+        parsha, _ = self._parsha_for_button(button)
+        self._pending_parsha = parsha
+        self._refresh_timer.start()
 
         # Update the date header to show when this parsha is read
-        if parsha:
-            heb_year = self.year_spinbox.value()
-            diaspora = self.diaspora_radio.isChecked()
-            parsha_date = _get_parsha_date(parsha, heb_year, diaspora)
-            if parsha_date:
-                qdate = QDate(parsha_date.year, parsha_date.month, parsha_date.day)
-                self._update_date_header(qdate)
-                self.selected_date = qdate
+        heb_year = self.year_spinbox.value()
+        diaspora = self.diaspora_radio.isChecked()
+        parsha_date = _get_parsha_date(parsha, heb_year, diaspora)
+        if parsha_date:
+            qdate = QDate(parsha_date.year, parsha_date.month, parsha_date.day)
+            self._update_date_header(qdate)
+            self.selected_date = qdate
 
     def _on_year_changed(self, value: int) -> None:
         """Update labels when the Hebrew year spinbox changes."""
-        greg = value - 3760
-        self.greg_range_label.setText(f"({greg}/{greg + 1})")
-        self.cycle_label.setText(f"Cycle for {value}:")
+        greg_range, cycle_text = _year_labels(value)
+        self.greg_range_label.setText(greg_range)
+        self.cycle_label.setText(cycle_text)
         # Refresh parsha date if one is selected
         btn = self.parsha_button_group.checkedButton()
-        if btn:
-            parsha = getattr(btn, "parsha_name", None)
-            if parsha:
-                parsha_date = _get_parsha_date(parsha, value, self.diaspora_radio.isChecked())
-                if parsha_date:
-                    qdate = QDate(parsha_date.year, parsha_date.month, parsha_date.day)
-                    self._update_date_header(qdate)
-                    self.selected_date = qdate
+        if btn is None:
+            return
+        parsha, _ = self._parsha_for_button(btn)
+        parsha_date = _get_parsha_date(parsha, value, self.diaspora_radio.isChecked())
+        if parsha_date:
+            qdate = QDate(parsha_date.year, parsha_date.month, parsha_date.day)
+            self._update_date_header(qdate)
+            self.selected_date = qdate
+
+    def _rebuild_date_index(self, heb_year: int) -> None:
+        """Index Shabbat dates → parsha for *heb_year* and its neighbours.
+
+        Calendar lookups reuse the index and only rebuild it for dates
+        outside the covered years.
+        """
+        years = (heb_year - 1, heb_year, heb_year + 1)
+        date_to_parsha: Dict[_dt.date, str] = {}
+        for hy in years:
+            date_to_parsha.update(_reverse_parsha_map(hy))
+        self._date_to_parsha = date_to_parsha
+        self._date_index_years = years
 
     def _update_date_header(self, qdate: QDate) -> None:
         """Update the header label with Gregorian and Hebrew dates."""
         greg_str = qdate.toString("MMM dd, yyyy")
-        heb_str = _gregorian_to_hebrew_approx(qdate)
+        heb_str = _hebrew_date_for_jd(qdate.toJulianDay())
         if heb_str:
             self.date_header_label.setText(f"{greg_str} / {heb_str}")
         else:
@@ -1848,18 +2230,13 @@ class OpenReadingDialog(QDialog):
                 days_to_sat = 7
             gdate = gdate + _dt.timedelta(days=days_to_sat)
 
-        # Estimate Hebrew year for lookup
+        # A Gregorian year overlaps Hebrew years approx_hy and approx_hy + 1
         approx_hy = gdate.year + 3760
-        date_to_parsha: Dict[_dt.date, str] = {}
-        _schedule_fn = _hc_parsha_schedule if _HC_AVAILABLE else _get_parsha_schedule_diaspora
-        for hy in (approx_hy - 1, approx_hy, approx_hy + 1):
-            try:
-                for parsha, d in _schedule_fn(hy).items():
-                    date_to_parsha[d] = parsha
-            except Exception:
-                pass
+        if (approx_hy not in self._date_index_years
+                or approx_hy + 1 not in self._date_index_years):
+            self._rebuild_date_index(approx_hy)
 
-        parsha = date_to_parsha.get(gdate)
+        parsha = self._date_to_parsha.get(gdate)
         if not parsha:
             return
 
@@ -1868,17 +2245,30 @@ class OpenReadingDialog(QDialog):
 
         # Find and check the matching radio button, then refresh options
         for btn in self.parsha_button_group.buttons():
-            pname = getattr(btn, "parsha_name", btn.text())
+            pname, _ = self._parsha_for_button(btn)
             # Handle combined parshas: "Nitzavim+Vayeilech" matches either part
             if pname == parsha or parsha.startswith(pname) or pname.startswith(parsha):
                 btn.setChecked(True)
                 self._refresh_option_lists(pname)
                 break
 
-    def _edit_custom_reading(self, reading_name: str) -> None:
-        """Open the sub‑dialog for editing a custom aliyah."""
-        dlg = CustomReadingEditDialog(reading_name, self)
-        dlg.exec()
+    def _edit_custom_reading(self, row: int) -> None:
+        """Open the sub‑dialog for editing the custom aliyah in *row*.
+
+        The entered range is shown in the table once the dialog is
+        accepted.
+        """
+        dlg = CustomReadingEditDialog(self.custom_model.aliyah_name(row), self)
+        if dlg.exec() == QDialog.DialogCode.Accepted:
+            self.custom_model.set_reference(row, dlg.reference())
+
+    def _edit_custom_reading_from_sender(self) -> None:
+        """Shared slot for all Edit buttons; the row comes from the sender."""
+        self._edit_custom_reading(self.sender().property("aliyah_row"))
+
+    def _clear_custom_reading_from_sender(self) -> None:
+        """Shared slot for all Clear buttons; the row comes from the sender."""
+        self.custom_model.clear_reference(self.sender().property("aliyah_row"))
 
     # ------------------------------------------------------------------ #
     # Accept handlers
@@ -1896,6 +2286,7 @@ class OpenReadingDialog(QDialog):
 
     def _on_open_haftarah(self) -> None:
         self.reading_type = "Haftarah"
+        self._flush_pending_refresh()
         # Capture which specific haftarah option the user selected
         item = self.haftarah_list.currentItem()
         if item:
@@ -1906,32 +2297,37 @@ class OpenReadingDialog(QDialog):
 
     def _accept_selection(self) -> None:
         """Accept the dialog after resolving the current tab's selection."""
+        self._flush_pending_refresh()
         self._gather_common()
-        tab = self.main_tabs.currentIndex()
-
-        if tab == 0:  # Shabbat readings
-            btn = self.parsha_button_group.checkedButton()
-            if btn:
-                self.selected_parsha = getattr(btn, "parsha_name", btn.text())
-                self.selected_book = getattr(btn, "book_name", "")
-                self.accept()
-        elif tab == 1:  # Holidays
-            btn = self.holiday_button_group.checkedButton()
-            if btn:
-                self.selected_parsha = btn.text()
-                self.selected_book = "Holiday"
-                # For standalone Megilla buttons set the correct reading_type
-                # so main_window can look up the right book and verse numbering.
-                megilla_type = _STANDALONE_MEGILLA_TYPE.get(btn.text())
-                if megilla_type:
-                    self.reading_type = megilla_type
-                self.accept()
-        elif tab == 2:  # Custom
-            name = self.custom_name_combo.currentText()
-            if name and name != "- Select reading or enter new name -":
-                self.selected_parsha = name
-                self.selected_book = "Custom"
-                self.accept()
+        handler = self._tab_accept.get(self.main_tabs.currentIndex())
+        if handler:
+            handler()
+
+    def _accept_shabbat(self) -> None:
+        """Accept the checked parsha on the Shabbat tab."""
+        btn = self.parsha_button_group.checkedButton()
+        if btn:
+            self.selected_parsha, self.selected_book = self._parsha_for_button(btn)
+            self.accept()
+
+    def _accept_holiday(self) -> None:
+        """Accept the checked holiday or standalone Megilla."""
+        btn = self.holiday_button_group.checkedButton()
+        if btn:
+            self.selected_parsha = btn.property("parsha")
+            self.selected_book = btn.property("book")
+            reading_type = btn.property("reading_type")
+            if reading_type:
+                self.reading_type = reading_type
+            self.accept()
+
+    def _accept_custom(self) -> None:
+        """Accept the named custom reading."""
+        name = self.custom_name_combo.currentText()
+        if name and name != "- Select reading or enter new name -":
+            self.selected_parsha = name
+            self.selected_book = "Custom"
+            self.accept()
 
     # Legacy public methods for backward compatibility
     def accept_torah(self) -> None:
@@ -46,10 +46,14 @@ musical notation and translation panels.
 
 from __future__ import annotations
 
+import html
 import unicodedata
-from typing import Dict, Iterable, List, Optional, Tuple
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 
-from PyQt6.QtCore import Qt, pyqtSignal, QPointF
+from PyQt6.QtCore import Qt, pyqtSignal, QPointF, QTimer
 from PyQt6.QtGui import (
     QColor,
     QFont,
@@ -58,6 +62,7 @@ from PyQt6.QtGui import (
     QTextBlockFormat,
     QTextCharFormat,
     QTextCursor,
+    QTextDocument,
     QMouseEvent,
     QPalette,
 )
@@ -121,7 +126,7 @@ _STAM_FONT_CANDIDATES = [
 
 def _resolve_stam_font() -> QFont:
     """Return the best available STAM Sefarad font."""
-    families = QFontDatabase.families()
+    families = set(QFontDatabase.families())
     for name in _STAM_FONT_CANDIDATES:
         if name in families:
             return QFont(name, 24)
@@ -142,6 +147,7 @@ def get_stam_font() -> QFont:
     return _STAM_FONT
 
 
+@lru_cache(maxsize=256)
 def _darken_color(hex_color: str, factor: float = 0.55) -> str:
     """Return a darkened version of a hex colour string.
 
@@ -156,6 +162,17 @@ def _darken_color(hex_color: str, factor: float = 0.55) -> str:
     return QColor(r, g, b).name()
 
 
+class _CachedRender(NamedTuple):
+    """A built modern/STAM document kept across view or colour switches."""
+
+    document: QTextDocument
+    seg_starts: array
+    seg_tokens: array
+    map_len: int
+    token_runs: array
+    selected: int
+
+
 class ModernTorahTextWidget(QTextEdit):
     """Widget for displaying Hebrew cantillation with multiple modes.
 
@@ -173,6 +190,10 @@ class ModernTorahTextWidget(QTextEdit):
         super().__init__(parent)
         self.setReadOnly(True)
         self.setFont(QFont("Times New Roman", 22))
+        # Documents are owned here rather than by the editor, so that a
+        # built document survives being swapped out (see _doc_cache)
+        self._doc: QTextDocument = self._new_document()
+        self.setDocument(self._doc)
         # Dark background like original TropeTrainer
         self.setStyleSheet(
             "QTextEdit { background-color: #1a1a2e; color: white; "
@@ -191,10 +212,38 @@ class ModernTorahTextWidget(QTextEdit):
         self.content: List[Tuple[str, str, str]] = []
         # Per-token verse/chapter/aliyah metadata (optional)
         self.verse_metadata: List[dict] = []
-        # Track which character positions map to which token index
-        self._char_to_token: List[int] = []
+        # Consonant-only form of each token, built on first STAM/tikkun render
+        self._stripped: Optional[List[str]] = None
+        # Tikkun table HTML for the current content, built on first use
+        self._tikkun_html: Optional[str] = None
+        # Map of document positions to token indices as runs: run k starts
+        # at position _seg_starts[k] and maps to token _seg_tokens[k] (-1
+        # for verse labels, banners and block separators)
+        self._seg_starts = array("i")
+        self._seg_tokens = array("i")
+        self._map_len: int = 0
+        # Token index → its run in the map, for restyling one word in place
+        self._token_runs = array("i")
         # Currently selected token index
         self._selected_index: int = -1
+        # Documents built for the current content under another
+        # (view_mode, color_mode); _doc_key is the pair the displayed
+        # document was built for, or None if it is not reusable
+        self._doc_key: Optional[Tuple[str, str]] = None
+        self._doc_cache: Dict[Tuple[str, str], _CachedRender] = {}
+        # Word formats keyed by (font role, background, foreground) and
+        # brushes keyed by colour string; keys carry the actual colours,
+        # so palette changes never hit a stale entry
+        self._modern_font = QFont("Times New Roman", 22)
+        self._fmt_cache: Dict[Tuple[str, Optional[str], str], QTextCharFormat] = {}
+        self._brush_cache: Dict[str, QBrush] = {}
+        self._verse_fmt: Optional[QTextCharFormat] = None
+        # Pending run of consecutive same-format text, see _queue_text
+        self._run_parts: List[str] = []
+        self._run_fmt: Optional[QTextCharFormat] = None
+        # Resolve the STAM font once the event loop is idle, so the first
+        # switch to the STAM or tikkun view does not scan the font database
+        QTimer.singleShot(0, get_stam_font)
 
     # ── Public API ───────────────────────────────────────────────────
 
@@ -211,6 +260,8 @@ class ModernTorahTextWidget(QTextEdit):
             (t.word, t.group_name, t.symbol) for t in self.tokens
         ]
         self.verse_metadata = []
+        self._stripped = None
+        self._tikkun_html = None
         self._selected_index = -1
         self.update_display()
 
@@ -236,6 +287,8 @@ class ModernTorahTextWidget(QTextEdit):
             self.verse_metadata = list(verse_metadata)
         else:
             self.verse_metadata = []
+        self._stripped = None
+        self._tikkun_html = None
         self._selected_index = -1
         self.update_display()
 
@@ -253,18 +306,24 @@ class ModernTorahTextWidget(QTextEdit):
                 verse_end=False,
             ))
         self.verse_metadata = []
+        self._stripped = None
+        self._tikkun_html = None
         self._selected_index = -1
         self.update_display()
 
     def set_view_mode(self, mode: str) -> None:
-        if mode in {"modern", "stam", "tikkun"}:
+        # Re-selecting the current mode (e.g. a toolbar sync) is a no-op
+        if mode in {"modern", "stam", "tikkun"} and mode != self.view_mode:
+            self._stash_document()
             self.view_mode = mode
-            self.update_display()
+            self._show_cached_or_render()
 
     def set_color_mode(self, mode: str) -> None:
-        if mode in {"no_colors", "trope_colors", "symbol_colors"}:
+        if (mode in {"no_colors", "trope_colors", "symbol_colors"}
+                and mode != self.color_mode):
+            self._stash_document()
             self.color_mode = mode
-            self.update_display()
+            self._show_cached_or_render()
 
     def highlight_word_at_index(self, index: int) -> None:
         """Hebe das Wort mit dem gegebenen Index farbig hervor.
@@ -278,14 +337,18 @@ class ModernTorahTextWidget(QTextEdit):
         index = max(0, min(index, len(self.tokens) - 1))
         if self._selected_index == index:
             return  # Kein unnötiges Re-Render
-        # Scrollposition merken
+        old_index, self._selected_index = self._selected_index, index
+        # Nur die zwei betroffenen Wörter neu formatieren, wenn möglich
+        if not self._restyle_selection(old_index, index):
+            self._rerender_keeping_scroll()
+
+    def _rerender_keeping_scroll(self) -> None:
+        """Rebuild the document while keeping the scroll position."""
         vbar = self.verticalScrollBar()
         hbar = self.horizontalScrollBar()
         v_pos = vbar.value()
         h_pos = hbar.value()
-        self._selected_index = index
-        self.update_display()
-        # Scrollposition wiederherstellen
+        self._render()
         vbar.setValue(v_pos)
         hbar.setValue(h_pos)
 
@@ -297,8 +360,9 @@ class ModernTorahTextWidget(QTextEdit):
     def mousePressEvent(self, event: QMouseEvent) -> None:
         """Detect which word was clicked and emit word_clicked signal.
 
-        The vertical scroll position is saved before and restored after
-        the re-render so the view does not jump to the top on every click.
+        Only the previously and newly selected words are restyled, so the
+        view keeps its scroll position; a full re-render (with the scroll
+        position restored) is the fallback.
         """
         if event.button() == Qt.MouseButton.LeftButton and self.tokens:
             pos_point = (
@@ -308,25 +372,18 @@ class ModernTorahTextWidget(QTextEdit):
             )
             cursor = self.cursorForPosition(pos_point)
             pos = cursor.position()
-            if 0 <= pos < len(self._char_to_token):
-                token_idx = self._char_to_token[pos]
-                if 0 <= token_idx < len(self.tokens):
-                    token = self.tokens[token_idx]
-                    self._selected_index = token_idx
-                    # ── Save scroll position before re-render ──
-                    vbar = self.verticalScrollBar()
-                    hbar = self.horizontalScrollBar()
-                    v_pos = vbar.value()
-                    h_pos = hbar.value()
-                    self.update_display()
-                    # ── Restore scroll position after re-render ──
-                    vbar.setValue(v_pos)
-                    hbar.setValue(h_pos)
-                    self.word_clicked.emit(
-                        token.word,
-                        token.group_name,
-                        token.trope_marks,
-                    )
+            token_idx = self._token_at(pos)
+            if 0 <= token_idx < len(self.tokens):
+                token = self.tokens[token_idx]
+                old_index, self._selected_index = self._selected_index, token_idx
+                # ── Restyle the two words, or re-render as a fallback ──
+                if not self._restyle_selection(old_index, token_idx):
+                    self._rerender_keeping_scroll()
+                self.word_clicked.emit(
+                    token.word,
+                    token.group_name,
+                    token.trope_marks,
+                )
         # Do NOT call super() – we handle everything ourselves.
         # This also prevents Qt from moving the text cursor / selecting text.
 
@@ -343,17 +400,230 @@ class ModernTorahTextWidget(QTextEdit):
     # ── Display dispatcher ───────────────────────────────────────────
 
     def update_display(self) -> None:
+        """Rebuild the display, dropping documents kept for other modes."""
+        self._doc_cache.clear()
+        self._render()
+
+    def _render(self) -> None:
+        """Build the document for the current view and colour mode."""
+        self._doc_key = None
         if not self.tokens:
             self.clear()
             return
-        if self.view_mode == "modern":
-            self._display_modern()
-        elif self.view_mode == "stam":
-            self._display_stam()
-        elif self.view_mode == "tikkun":
-            self._display_tikkun()
+        # Render with painting and signals suspended so the document is
+        # laid out and repainted once, not after every insertion
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            if self.view_mode == "modern":
+                self._display_modern()
+            elif self.view_mode == "stam":
+                self._display_stam()
+            elif self.view_mode == "tikkun":
+                self._display_tikkun()
+            else:
+                self._display_modern()
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.viewport().update()
+        if self.view_mode in ("modern", "stam"):
+            self._doc_key = (self.view_mode, self.color_mode)
+
+    # ── Helper: documents kept across mode switches ──────────────────
+
+    def _new_document(self) -> QTextDocument:
+        """Return an empty document set up like the editor's own."""
+        doc = QTextDocument()
+        # Read-only view: renders need no undo history
+        doc.setUndoRedoEnabled(False)
+        doc.setDefaultFont(self.font())
+        return doc
+
+    def _stash_document(self) -> None:
+        """Keep the displayed document before the mode changes.
+
+        The document and its position map go into :attr:`_doc_cache`
+        and an empty document takes its place for the next render.
+        """
+        if self._doc_key is None:
+            return
+        self._doc_cache[self._doc_key] = _CachedRender(
+            self._doc, self._seg_starts, self._seg_tokens, self._map_len,
+            self._token_runs, self._selected_index,
+        )
+        self._doc_key = None
+        self._doc = self._new_document()
+        self.setDocument(self._doc)
+
+    def _show_cached_or_render(self) -> None:
+        """Show the kept document for the current modes, or render one.
+
+        A kept document only needs its selection highlight moved if the
+        selection changed while it was hidden.
+        """
+        key = (self.view_mode, self.color_mode)
+        cached = self._doc_cache.pop(key, None)
+        if cached is None:
+            self._render()
+            return
+        self._doc = cached.document
+        self.setDocument(self._doc)
+        self._seg_starts = cached.seg_starts
+        self._seg_tokens = cached.seg_tokens
+        self._map_len = cached.map_len
+        self._token_runs = cached.token_runs
+        self._doc_key = key
+        if cached.selected != self._selected_index:
+            self._restyle_selection(cached.selected, self._selected_index)
+
+    # ── Helper: document reset ───────────────────────────────────────
+
+    def _reset_document(self) -> None:
+        """Empty the current document in place for a cursor-built render.
+
+        Unlike ``QTextEdit.clear()``, this keeps the existing
+        ``QTextDocument`` and skips the plain-text reset round-trip.
+        """
+        self.document().clear()
+        self.setCurrentCharFormat(QTextCharFormat())
+
+    # ── Helper: position → token map ─────────────────────────────────
+
+    def _reset_char_map(self) -> None:
+        """Forget the position map before a new render."""
+        self._seg_starts = array("i")
+        self._seg_tokens = array("i")
+        self._map_len = 0
+        self._token_runs = array("i")
+
+    def _map_chars(self, count: int, token_idx: int) -> None:
+        """Record that the next *count* document positions show *token_idx*.
+
+        Adjacent positions of the same token extend the current run, so
+        the map grows per word or label rather than per character.
+        """
+        if count <= 0:
+            return
+        if not self._seg_tokens or self._seg_tokens[-1] != token_idx:
+            if token_idx == len(self._token_runs):
+                self._token_runs.append(len(self._seg_tokens))
+            self._seg_starts.append(self._map_len)
+            self._seg_tokens.append(token_idx)
+        self._map_len += count
+
+    def _token_span(self, token_idx: int) -> Tuple[int, int]:
+        """Return the ``(start, end)`` document positions of a token."""
+        run = self._token_runs[token_idx]
+        end = (self._seg_starts[run + 1] if run + 1 < len(self._seg_starts)
+               else self._map_len)
+        return self._seg_starts[run], end
+
+    def _restyle_selection(self, old_index: int, new_index: int) -> bool:
+        """Move the selection highlight without rebuilding the document.
+
+        Only the two affected words are reformatted.  Returns ``False``
+        when the current document cannot be patched in place and a full
+        :meth:`update_display` is needed instead.
+        """
+        if self.view_mode == "tikkun":
+            return True  # the tikkun table does not show the selection
+        if self.view_mode not in ("modern", "stam"):
+            return False
+        if len(self._token_runs) != len(self.tokens):
+            return False
+        cursor = QTextCursor(self.document())
+        cursor.beginEditBlock()
+        for idx in (old_index, new_index):
+            if 0 <= idx < len(self.tokens):
+                start, end = self._token_span(idx)
+                cursor.setPosition(start)
+                cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+                cursor.setCharFormat(
+                    self._token_format(self.tokens[idx], idx == new_index))
+        cursor.endEditBlock()
+        return True
+
+    def _token_at(self, pos: int) -> int:
+        """Return the token index at document position *pos*, or -1."""
+        if not 0 <= pos < self._map_len:
+            return -1
+        return self._seg_tokens[bisect_right(self._seg_starts, pos) - 1]
+
+    # ── Helper: cached word data and formats ─────────────────────────
+
+    def _stripped_words(self) -> List[str]:
+        """Return the consonant-only form of every token, computed once."""
+        if self._stripped is None or len(self._stripped) != len(self.tokens):
+            self._stripped = [_strip_diacritics(t.word) for t in self.tokens]
+        return self._stripped
+
+    def _brush(self, color: str) -> QBrush:
+        """Return a shared solid brush for a colour string."""
+        brush = self._brush_cache.get(color)
+        if brush is None:
+            brush = self._brush_cache[color] = QBrush(QColor(color))
+        return brush
+
+    def _word_format(
+        self, font_role: str, background: Optional[str], foreground: str
+    ) -> QTextCharFormat:
+        """Return the shared character format for a word.
+
+        *font_role* is ``"modern"`` or ``"stam"``; *background* may be
+        ``None`` to leave the background unset.  ``insertText`` copies
+        the format, so one instance can serve every matching word.
+        """
+        key = (font_role, background, foreground)
+        fmt = self._fmt_cache.get(key)
+        if fmt is None:
+            fmt = QTextCharFormat()
+            fmt.setFont(self._modern_font if font_role == "modern" else get_stam_font())
+            if background is not None:
+                fmt.setBackground(self._brush(background))
+            fmt.setForeground(self._brush(foreground))
+            self._fmt_cache[key] = fmt
+        return fmt
+
+    def _queue_text(
+        self, cursor: QTextCursor, text: str, fmt: QTextCharFormat
+    ) -> None:
+        """Append *text* to the pending run, flushing on a format change.
+
+        Consecutive words sharing a cached format are inserted with one
+        ``insertText`` call; the resulting document is identical.
+        """
+        if fmt is not self._run_fmt:
+            self._flush_run(cursor)
+            self._run_fmt = fmt
+        self._run_parts.append(text)
+
+    def _flush_run(self, cursor: QTextCursor) -> None:
+        """Insert the pending text run, if any."""
+        if self._run_parts:
+            cursor.insertText("".join(self._run_parts), self._run_fmt)
+            self._run_parts.clear()
+        self._run_fmt = None
+
+    def _token_format(self, token: Token, is_selected: bool) -> QTextCharFormat:
+        """Return the format for *token* in the current view and colour mode.
+
+        The modern view colours symbol mode by symbol; the STAM view keeps
+        the trope colour in both colour modes.  A selected word gets a
+        darker background (or a slight highlight without colours).
+        """
+        font_role = "stam" if self.view_mode == "stam" else "modern"
+        if self.color_mode == "no_colors":
+            # White text; selected = slightly highlighted
+            return self._word_format(
+                font_role, "#3a3a5e" if is_selected else None, "#FFFFFF")
+        if self.color_mode == "symbol_colors" and font_role == "modern":
+            bg = self.symbol_colors.get(token.symbol, "#FFFFFF")
         else:
-            self._display_modern()
+            bg = token.color
+        if is_selected:
+            bg = _darken_color(bg)
+        return self._word_format(font_role, bg, "#000000")
 
     # ── Helper: verse number / aliyah banner insertion ────────────────
 
@@ -367,44 +637,45 @@ class ModernTorahTextWidget(QTextEdit):
         self, cursor: QTextCursor, aliyah_num: int, aliyah_name: str
     ) -> None:
         """Insert a full-width coloured aliyah header banner."""
+        self._flush_run(cursor)
         display_name = aliyah_name or ALIYAH_NAMES.get(aliyah_num, f"Aliyah {aliyah_num}")
         color_hex = ALIYAH_BANNER_COLORS.get(aliyah_num, "#555555")
 
         blank_fmt = QTextCharFormat()
-        blank_fmt.setBackground(QBrush(QColor("#1a1a2e")))
-        blank_fmt.setForeground(QBrush(QColor("#1a1a2e")))
+        blank_fmt.setBackground(self._brush("#1a1a2e"))
+        blank_fmt.setForeground(self._brush("#1a1a2e"))
 
         # ── blank line before banner ──
         # insertBlock() inserts a block-separator at the current document
         # position. That separator occupies exactly one position and MUST be
-        # tracked in _char_to_token or every subsequent position will be off.
+        # tracked in the position map or every subsequent position will be off.
         cursor.insertBlock()
-        self._char_to_token.append(-1)          # ← block separator position
+        self._map_chars(1, -1)          # ← block separator position
         cursor.insertText(" ", blank_fmt)
-        self._char_to_token.append(-1)          # ← the space character
+        self._map_chars(1, -1)          # ← the space character
 
         # ── banner block ──
         banner_block_fmt = QTextBlockFormat()
         banner_block_fmt.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        banner_block_fmt.setBackground(QBrush(QColor(color_hex)))
+        banner_block_fmt.setBackground(self._brush(color_hex))
         banner_block_fmt.setTopMargin(4)
         banner_block_fmt.setBottomMargin(4)
         cursor.insertBlock(banner_block_fmt)
-        self._char_to_token.append(-1)          # ← block separator position
+        self._map_chars(1, -1)          # ← block separator position
 
         banner_fmt = QTextCharFormat()
         banner_fmt.setFont(QFont("Arial", 11, QFont.Weight.Bold))
-        banner_fmt.setBackground(QBrush(QColor(color_hex)))
-        banner_fmt.setForeground(QBrush(QColor("#FFFFFF")))
+        banner_fmt.setBackground(self._brush(color_hex))
+        banner_fmt.setForeground(self._brush("#FFFFFF"))
         banner_text = f"  ── {display_name}  (Aliyah {aliyah_num})  ──  "
         cursor.insertText(banner_text, banner_fmt)
-        self._char_to_token.extend([-1] * len(banner_text))   # ← banner chars
+        self._map_chars(len(banner_text), -1)   # ← banner chars
 
         # ── blank line after banner ──
         cursor.insertBlock()
-        self._char_to_token.append(-1)          # ← block separator position
+        self._map_chars(1, -1)          # ← block separator position
         cursor.insertText(" ", blank_fmt)
-        self._char_to_token.append(-1)          # ← the space character
+        self._map_chars(1, -1)          # ← the space character
 
     def _insert_verse_number(
         self,
@@ -422,6 +693,7 @@ class ModernTorahTextWidget(QTextEdit):
 
         Format: ``26:1`` (chapter:verse) in light-gray on the right.
         """
+        self._flush_run(cursor)
         # ── New block: RTL, justified (Blocksatz) ──
         verse_block_fmt = QTextBlockFormat()
         verse_block_fmt.setAlignment(Qt.AlignmentFlag.AlignJustify)
@@ -429,17 +701,19 @@ class ModernTorahTextWidget(QTextEdit):
         verse_block_fmt.setTopMargin(3)
         verse_block_fmt.setBottomMargin(3)
         cursor.insertBlock(verse_block_fmt)
-        self._char_to_token.append(-1)          # ← block separator position
+        self._map_chars(1, -1)          # ← block separator position
 
         # ── Verse number label: "chapter:verse" ──
-        verse_fmt = QTextCharFormat()
-        verse_fmt.setFont(QFont("Arial", 10))
-        verse_fmt.setForeground(QBrush(QColor("#A0A0A0")))
-        verse_fmt.setBackground(QBrush(QColor("#1a1a2e")))
+        verse_fmt = self._verse_fmt
+        if verse_fmt is None:
+            verse_fmt = self._verse_fmt = QTextCharFormat()
+            verse_fmt.setFont(QFont("Arial", 10))
+            verse_fmt.setForeground(self._brush("#A0A0A0"))
+            verse_fmt.setBackground(self._brush("#1a1a2e"))
 
         label = f"{chapter}:{verse}  "
         cursor.insertText(label, verse_fmt)
-        self._char_to_token.extend([-1] * len(label))
+        self._map_chars(len(label), -1)
 
     # ── Modern display ───────────────────────────────────────────────
 
@@ -450,9 +724,10 @@ class ModernTorahTextWidget(QTextEdit):
         right margin (inserted first in the RTL block) and aliyah
         dividers are shown as coloured banners.
         """
-        self.clear()
-        self._char_to_token = []
+        self._reset_document()
+        self._reset_char_map()
         cursor = self.textCursor()
+        cursor.beginEditBlock()
         has_meta = bool(self.verse_metadata)
 
         # ── Set up first block ──
@@ -479,9 +754,16 @@ class ModernTorahTextWidget(QTextEdit):
         # ── Render tokens ──
         prev_verse: Optional[int] = None
         prev_chapter: Optional[int] = None
+        # Bound methods and per-render constants, looked up once
+        meta_at = self._meta
+        token_format = self._token_format
+        queue_text = self._queue_text
+        map_chars = self._map_chars
+        selected = self._selected_index
+        show_symbols = self.color_mode == "symbol_colors"
 
         for idx, token in enumerate(self.tokens):
-            meta = self._meta(idx)
+            meta = meta_at(idx)
             cur_verse = meta["verse"] if meta else None
             cur_chapter = meta["chapter"] if meta else None
 
@@ -510,42 +792,21 @@ class ModernTorahTextWidget(QTextEdit):
                 )
 
             # ── Format and insert word ──
-            fmt = QTextCharFormat()
-            fmt.setFont(QFont("Times New Roman", 22))
-            is_selected = (idx == self._selected_index)
-
-            if self.color_mode == "trope_colors":
-                bg_color = token.color
-                if is_selected:
-                    # Darker background to highlight selected word
-                    bg_color = _darken_color(token.color)
-                fmt.setBackground(QBrush(QColor(bg_color)))
-                fmt.setForeground(QBrush(QColor("#000000")))
-
-            elif self.color_mode == "symbol_colors":
-                s_color = self.symbol_colors.get(token.symbol, "#FFFFFF")
-                if is_selected:
-                    s_color = _darken_color(s_color)
-                fmt.setBackground(QBrush(QColor(s_color)))
-                fmt.setForeground(QBrush(QColor("#000000")))
+            fmt = token_format(token, idx == selected)
+            if show_symbols:
                 sym_text = f"{token.symbol} "
-                cursor.insertText(sym_text, fmt)
-                self._char_to_token.extend([idx] * len(sym_text))
-
-            else:
-                # no colours: white text; selected = slightly highlighted
-                if is_selected:
-                    fmt.setBackground(QBrush(QColor("#3a3a5e")))
-                fmt.setForeground(QBrush(QColor("#FFFFFF")))
+                queue_text(cursor, sym_text, fmt)
+                map_chars(len(sym_text), idx)
 
             word_text = token.word + " "
-            cursor.insertText(word_text, fmt)
-            self._char_to_token.extend([idx] * len(word_text))
+            queue_text(cursor, word_text, fmt)
+            map_chars(len(word_text), idx)
 
             # ── End-of-verse line break (no-metadata fallback) ──
             if token.verse_end and not has_meta:
+                self._flush_run(cursor)
                 cursor.insertBlock()
-                self._char_to_token.append(-1)   # ← block separator position
+                map_chars(1, -1)   # ← block separator position
                 fb = QTextBlockFormat()
                 fb.setAlignment(Qt.AlignmentFlag.AlignJustify)
                 fb.setLayoutDirection(Qt.LayoutDirection.RightToLeft)
@@ -555,6 +816,9 @@ class ModernTorahTextWidget(QTextEdit):
                 prev_verse = cur_verse
                 prev_chapter = cur_chapter
 
+        self._flush_run(cursor)
+        cursor.endEditBlock()
+
     # ── STAM display ─────────────────────────────────────────────────
 
     def _display_stam(self) -> None:
@@ -565,11 +829,12 @@ class ModernTorahTextWidget(QTextEdit):
         correctly.  Verse numbers and aliyah banners are included when
         metadata is available.
         """
-        self.clear()
-        self._char_to_token = []
+        self._reset_document()
+        self._reset_char_map()
         cursor = self.textCursor()
-        stam_font = get_stam_font()
+        cursor.beginEditBlock()
         has_meta = bool(self.verse_metadata)
+        stripped_words = self._stripped_words()
 
         if has_meta:
             first_meta = self.verse_metadata[0] if self.verse_metadata else {}
@@ -591,10 +856,16 @@ class ModernTorahTextWidget(QTextEdit):
             cursor.setBlockFormat(block_fmt)
 
         prev_verse: Optional[int] = None
+        # Bound methods and per-render constants, looked up once
+        meta_at = self._meta
+        token_format = self._token_format
+        queue_text = self._queue_text
+        map_chars = self._map_chars
+        selected = self._selected_index
 
         for idx, token in enumerate(self.tokens):
-            meta = self._meta(idx)
-            stripped = _strip_diacritics(token.word)
+            meta = meta_at(idx)
+            stripped = stripped_words[idx]
             cur_verse = meta["verse"] if meta else None
 
             if (
@@ -619,30 +890,15 @@ class ModernTorahTextWidget(QTextEdit):
                     cur_verse,
                 )
 
-            fmt = QTextCharFormat()
-            fmt.setFont(stam_font)
-            is_selected = (idx == self._selected_index)
-
-            if self.color_mode == "trope_colors":
-                bg = _darken_color(token.color) if is_selected else token.color
-                fmt.setBackground(QBrush(QColor(bg)))
-                fmt.setForeground(QBrush(QColor("#000000")))
-            elif self.color_mode == "symbol_colors":
-                bg = _darken_color(token.color) if is_selected else token.color
-                fmt.setBackground(QBrush(QColor(bg)))
-                fmt.setForeground(QBrush(QColor("#000000")))
-            else:
-                if is_selected:
-                    fmt.setBackground(QBrush(QColor("#3a3a5e")))
-                fmt.setForeground(QBrush(QColor("#FFFFFF")))
-
+            fmt = token_format(token, idx == selected)
             word_text = stripped + " "
-            cursor.insertText(word_text, fmt)
-            self._char_to_token.extend([idx] * len(word_text))
+            queue_text(cursor, word_text, fmt)
+            map_chars(len(word_text), idx)
 
             if token.verse_end and not has_meta:
+                self._flush_run(cursor)
                 cursor.insertBlock()
-                self._char_to_token.append(-1)   # ← block separator position
+                map_chars(1, -1)   # ← block separator position
                 fb = QTextBlockFormat()
                 fb.setAlignment(Qt.AlignmentFlag.AlignJustify)
                 fb.setLayoutDirection(Qt.LayoutDirection.RightToLeft)
@@ -651,6 +907,9 @@ class ModernTorahTextWidget(QTextEdit):
             if meta:
                 prev_verse = cur_verse
 
+        self._flush_run(cursor)
+        cursor.endEditBlock()
+
     # ── Tikkun display ───────────────────────────────────────────────
 
     def _display_tikkun(self) -> None:
@@ -660,108 +919,131 @@ class ModernTorahTextWidget(QTextEdit):
         Right column: STAM Sefarad consonantal text.
 
         Verse numbers and aliyah headers are rendered in both columns
-        when metadata is available.
+        when metadata is available.  The table does not depend on the
+        colour mode or selection, so its HTML is built once per content.
         """
-        has_meta = bool(self.verse_metadata)
-        stam_font_name = get_stam_font().family()
+        self._reset_char_map()
+        if self._tikkun_html is not None:
+            self.setHtml(self._tikkun_html)
+            return
+        self._tikkun_html = _build_tikkun_html(
+            [t.word for t in self.tokens],
+            self._stripped_words(),
+            self.verse_metadata,
+            get_stam_font().family(),
+        )
+        self.setHtml(self._tikkun_html)
 
-        # ── Group tokens by verse ──
-        if has_meta:
-            verses: List[dict] = []
-            current_verse_tokens: List[Token] = []
-            current_meta: dict = {}
-            for idx, token in enumerate(self.tokens):
-                meta = self._meta(idx)
-                if meta and meta.get("is_verse_start") and current_verse_tokens:
-                    verses.append({
-                        "tokens": current_verse_tokens,
-                        "meta": current_meta,
-                    })
-                    current_verse_tokens = []
-                current_meta = meta or {}
-                current_verse_tokens.append(token)
-            if current_verse_tokens:
-                verses.append({
-                    "tokens": current_verse_tokens,
-                    "meta": current_meta,
-                })
-        else:
-            # No metadata: treat whole content as one block
-            verses = [{"tokens": self.tokens, "meta": {}}]
-
-        # ── Build HTML ──
-        rows_html = ""
-        last_aliyah = -1
-
-        for verse_data in verses:
-            meta = verse_data["meta"]
-            tokens_in_verse = verse_data["tokens"]
-
-            # Aliyah banner row
-            aliyah_num = meta.get("aliyah_num", 0)
-            if aliyah_num and aliyah_num != last_aliyah and meta.get("is_aliyah_start"):
-                last_aliyah = aliyah_num
-                color_hex = ALIYAH_BANNER_COLORS.get(aliyah_num, "#555555")
-                display_name = meta.get("aliyah_name") or ALIYAH_NAMES.get(aliyah_num, f"Aliyah {aliyah_num}")
-                rows_html += (
-                    f"<tr><td colspan='3' style='"
-                    f"background-color:{color_hex}; color:white; font-size:11pt; "
-                    f"font-weight:bold; text-align:center; padding:6px;'>"
-                    f"── {display_name}  (Aliyah {aliyah_num}) ──"
-                    f"</td></tr>"
-                )
 
-            # Verse number cell
-            chapter = meta.get("chapter", "")
-            verse = meta.get("verse", "")
-            verse_label = f"{chapter}:{verse}" if chapter and verse else ""
-
-            modern_words = " ".join(t.word for t in tokens_in_verse)
-            stam_words = " ".join(_strip_diacritics(t.word) for t in tokens_in_verse)
-
-            rows_html += (
-                f"<tr>"
-                f"<td style='width:8%; color:#A0A0A0; font-size:10pt; "
-                f"  text-align:center; vertical-align:top; padding:4px;'>"
-                f"  {verse_label}"
-                f"</td>"
-                f"<td style='width:46%; padding:8px; text-align:right; "
-                f"  font-size:20pt; font-family:Times New Roman; "
-                f"  color:white; direction:rtl; vertical-align:top;'>"
-                f"  {modern_words}"
-                f"</td>"
-                f"<td style='width:46%; padding:8px; text-align:right; "
-                f"  font-size:22pt; font-family:\"{stam_font_name}\"; "
-                f"  color:white; direction:rtl; vertical-align:top;'>"
-                f"  {stam_words}"
-                f"</td>"
-                f"</tr>"
+def _build_tikkun_html(
+    words: List[str],
+    stripped_words: List[str],
+    metadata: List[dict],
+    stam_font_name: str,
+) -> str:
+    """Return the tikkun table HTML for a passage.
+
+    *metadata* is either empty or parallel to *words*.
+    """
+    has_meta = bool(metadata)
+
+    # ── Group tokens by verse ──
+    # Verses are contiguous, so each is kept as a (start, end, meta) slice
+    if has_meta:
+        verses: List[Tuple[int, int, dict]] = []
+        verse_start = 0
+        current_meta: dict = {}
+        for idx, meta in enumerate(metadata):
+            if meta and meta.get("is_verse_start") and idx > verse_start:
+                verses.append((verse_start, idx, current_meta))
+                verse_start = idx
+            current_meta = meta or {}
+        if len(metadata) > verse_start:
+            verses.append((verse_start, len(metadata), current_meta))
+    else:
+        # No metadata: treat whole content as one block
+        verses = [(0, len(words), {})]
+
+    # ── Build HTML ──
+    rows: List[str] = []
+    last_aliyah = -1
+
+    for start, end, meta in verses:
+        # Aliyah banner row
+        aliyah_num = meta.get("aliyah_num", 0)
+        if aliyah_num and aliyah_num != last_aliyah and meta.get("is_aliyah_start"):
+            last_aliyah = aliyah_num
+            color_hex = ALIYAH_BANNER_COLORS.get(aliyah_num, "#555555")
+            display_name = html.escape(
+                meta.get("aliyah_name") or ALIYAH_NAMES.get(aliyah_num, f"Aliyah {aliyah_num}"))
+            rows.append(
+                f"<tr><td colspan='3' class='al' "
+                f"style='background-color:{color_hex};'>"
+                f"── {display_name}  (Aliyah {aliyah_num}) ──"
+                f"</td></tr>"
             )
 
-        html = (
-            "<table width='100%' border='0' style='"
-            "border-collapse:collapse; background-color:#1a1a2e;'>"
-            "<tr>"
-            "<th style='color:#A0A0A0; font-size:10pt; padding:4px;'>#</th>"
-            "<th style='color:#D0D0D0; font-size:11pt; padding:4px;'>Modern</th>"
-            "<th style='color:#D0D0D0; font-size:11pt; padding:4px;'>STAM Sefarad</th>"
-            "</tr>"
-            + rows_html
-            + "</table>"
+        # Verse number cell
+        chapter = meta.get("chapter", "")
+        verse = meta.get("verse", "")
+        verse_label = f"{chapter}:{verse}" if chapter and verse else ""
+
+        # Escape each verse once; the finished table is cached per content
+        modern_words = html.escape(" ".join(words[start:end]), quote=False)
+        stam_words = html.escape(
+            " ".join(stripped_words[start:end]), quote=False)
+
+        rows.append(
+            f"<tr>"
+            f"<td class='vnum'>  {verse_label}</td>"
+            f"<td class='mod'>  {modern_words}</td>"
+            f"<td class='stam'>  {stam_words}</td>"
+            f"</tr>"
         )
-        self.setHtml(html)
-        self._char_to_token = []
+
+    # Cell styles are declared once here rather than on every row
+    return (
+        "<style>"
+        "td.vnum { width:8%; color:#A0A0A0; font-size:10pt; "
+        "  text-align:center; vertical-align:top; padding:4px; }"
+        "td.mod { width:46%; padding:8px; text-align:right; "
+        "  font-size:20pt; font-family:Times New Roman; "
+        "  color:white; direction:rtl; vertical-align:top; }"
+        f"td.stam {{ width:46%; padding:8px; text-align:right; "
+        f"  font-size:22pt; font-family:\"{stam_font_name}\"; "
+        f"  color:white; direction:rtl; vertical-align:top; }}"
+        "td.al { color:white; font-size:11pt; font-weight:bold; "
+        "  text-align:center; padding:6px; }"
+        "</style>"
+        "<table width='100%' border='0' style='"
+        "border-collapse:collapse; background-color:#1a1a2e;'>"
+        "<tr>"
+        "<th style='color:#A0A0A0; font-size:10pt; padding:4px;'>#</th>"
+        "<th style='color:#D0D0D0; font-size:11pt; padding:4px;'>Modern</th>"
+        "<th style='color:#D0D0D0; font-size:11pt; padding:4px;'>STAM Sefarad</th>"
+        "</tr>"
+        + "".join(rows)
+        + "</table>"
+    )
 
 
 # ── Utility ───────────────────────────────────────────────────────────
 
+# Deletion table for str.translate: every combining character in the
+# Basic Multilingual Plane, which covers all Hebrew vowels and tropes.
+_COMBINING_TABLE: Dict[int, None] = dict.fromkeys(
+    cp for cp in range(0x10000) if unicodedata.combining(chr(cp))
+)
+
+
 def _strip_diacritics(word: str) -> str:
     """Remove all combining characters (vowels and tropes) from a word."""
-    return "".join(ch for ch in word if unicodedata.combining(ch) == 0)
+    return word.translate(_COMBINING_TABLE)
 
 
 # ── Chapter lengths for all Tanach books ─────────────────────────────
-# Maps (book_num, chapter) → number of verses in that chapter.
+# _CHAPTER_LENGTHS[book_num][chapter - 1] is the number of verses in that
+# chapter; index 0 is empty so book numbers index directly.
 # book_num mirrors sedrot_parser._BOOK_INFO:
 #   1=Bereshit 2=Shemot 3=Vayikra 4=Bamidbar 5=Devarim
 #   6=Joshua 7=Judges 8=I Samuel 9=II Samuel 10=I Kings 11=II Kings
@@ -771,187 +1053,206 @@ def _strip_diacritics(word: str) -> str:
 #   30=Ruth 31=Lamentations 32=Kohelet 33=Esther 34=Song of Songs
 #   35=Nehemiah 36=Ezra 37=I Chronicles 38=II Chronicles
 # Used by build_verse_metadata to advance the chapter number correctly.
-_TORAH_CHAPTER_LENGTHS: Dict[Tuple[int, int], int] = {
+_CHAPTER_LENGTHS: Tuple[Tuple[int, ...], ...] = (
+    (),  # 0 = unknown book
     # ── Bereshit (Genesis) ──
-    (1,1):31,(1,2):25,(1,3):24,(1,4):26,(1,5):32,(1,6):22,(1,7):24,
-    (1,8):22,(1,9):29,(1,10):32,(1,11):32,(1,12):20,(1,13):18,(1,14):24,
-    (1,15):21,(1,16):16,(1,17):27,(1,18):33,(1,19):38,(1,20):18,(1,21):34,
-    (1,22):24,(1,23):20,(1,24):67,(1,25):34,(1,26):35,(1,27):46,(1,28):22,
-    (1,29):35,(1,30):43,(1,31):54,(1,32):33,(1,33):20,(1,34):31,(1,35):29,
-    (1,36):43,(1,37):36,(1,38):30,(1,39):23,(1,40):23,(1,41):57,(1,42):38,
-    (1,43):34,(1,44):34,(1,45):28,(1,46):34,(1,47):31,(1,48):22,(1,49):33,
-    (1,50):26,
+    (
+        31, 25, 24, 26, 32, 22, 24, 22, 29, 32, 32, 20, 18, 24,
+        21, 16, 27, 33, 38, 18, 34, 24, 20, 67, 34, 35, 46, 22,
+        35, 43, 54, 33, 20, 31, 29, 43, 36, 30, 23, 23, 57, 38,
+        34, 34, 28, 34, 31, 22, 33, 26,
+    ),
     # ── Shemot (Exodus) ──
-    (2,1):22,(2,2):25,(2,3):22,(2,4):31,(2,5):23,(2,6):30,(2,7):29,
-    (2,8):28,(2,9):35,(2,10):29,(2,11):10,(2,12):51,(2,13):22,(2,14):31,
-    (2,15):27,(2,16):36,(2,17):16,(2,18):27,(2,19):25,(2,20):23,(2,21):37,
-    (2,22):30,(2,23):33,(2,24):18,(2,25):40,(2,26):37,(2,27):21,(2,28):43,
-    (2,29):46,(2,30):38,(2,31):18,(2,32):35,(2,33):23,(2,34):35,(2,35):35,
-    (2,36):38,(2,37):29,(2,38):31,(2,39):43,(2,40):38,
+    (
+        22, 25, 22, 31, 23, 30, 29, 28, 35, 29, 10, 51, 22, 31,
+        27, 36, 16, 27, 25, 23, 37, 30, 33, 18, 40, 37, 21, 43,
+        46, 38, 18, 35, 23, 35, 35, 38, 29, 31, 43, 38,
+    ),
     # ── Vayikra (Leviticus) ──
-    (3,1):17,(3,2):16,(3,3):17,(3,4):35,(3,5):26,(3,6):23,(3,7):38,
-    (3,8):36,(3,9):24,(3,10):20,(3,11):47,(3,12):8,(3,13):59,(3,14):57,
-    (3,15):33,(3,16):34,(3,17):16,(3,18):30,(3,19):37,(3,20):27,(3,21):24,
-    (3,22):33,(3,23):44,(3,24):23,(3,25):55,(3,26):46,(3,27):34,
+    (
+        17, 16, 17, 35, 26, 23, 38, 36, 24, 20, 47, 8, 59, 57,
+        33, 34, 16, 30, 37, 27, 24, 33, 44, 23, 55, 46, 34,
+    ),
     # ── Bamidbar (Numbers) ──
-    (4,1):54,(4,2):34,(4,3):51,(4,4):49,(4,5):31,(4,6):27,(4,7):89,
-    (4,8):26,(4,9):23,(4,10):36,(4,11):35,(4,12):16,(4,13):33,(4,14):45,
-    (4,15):41,(4,16):35,(4,17):28,(4,18):32,(4,19):22,(4,20):29,(4,21):35,
-    (4,22):41,(4,23):30,(4,24):25,(4,25):18,(4,26):65,(4,27):23,(4,28):31,
-    (4,29):39,(4,30):17,(4,31):54,(4,32):42,(4,33):56,(4,34):29,(4,35):34,
-    (4,36):13,
+    (
+        54, 34, 51, 49, 31, 27, 89, 26, 23, 36, 35, 16, 33, 45,
+        41, 35, 28, 32, 22, 29, 35, 41, 30, 25, 18, 65, 23, 31,
+        39, 17, 54, 42, 56, 29, 34, 13,
+    ),
     # ── Devarim (Deuteronomy) ──
-    (5,1):46,(5,2):37,(5,3):29,(5,4):49,(5,5):30,(5,6):25,(5,7):26,
-    (5,8):20,(5,9):29,(5,10):22,(5,11):32,(5,12):31,(5,13):19,(5,14):29,
-    (5,15):23,(5,16):22,(5,17):20,(5,18):22,(5,19):21,(5,20):20,(5,21):23,
-    (5,22):29,(5,23):26,(5,24):22,(5,25):19,(5,26):19,(5,27):26,(5,28):69,
-    (5,29):28,(5,30):20,(5,31):30,(5,32):52,(5,33):29,(5,34):12,
+    (
+        46, 37, 29, 49, 30, 25, 26, 20, 29, 22, 32, 31, 19, 29,
+        23, 22, 20, 22, 21, 20, 23, 29, 26, 22, 19, 19, 26, 69,
+        28, 20, 30, 52, 29, 12,
+    ),
     # ── Joshua (6) ──
-    (6,1):18,(6,2):24,(6,3):17,(6,4):24,(6,5):15,(6,6):27,(6,7):26,
-    (6,8):35,(6,9):27,(6,10):43,(6,11):23,(6,12):24,(6,13):33,(6,14):15,
-    (6,15):63,(6,16):10,(6,17):18,(6,18):28,(6,19):51,(6,20):9,(6,21):45,
-    (6,22):34,(6,23):16,(6,24):33,
+    (
+        18, 24, 17, 24, 15, 27, 26, 35, 27, 43, 23, 24, 33, 15,
+        63, 10, 18, 28, 51, 9, 45, 34, 16, 33,
+    ),
     # ── Judges (7) ──
-    (7,1):36,(7,2):23,(7,3):31,(7,4):24,(7,5):31,(7,6):40,(7,7):25,
-    (7,8):35,(7,9):57,(7,10):18,(7,11):40,(7,12):15,(7,13):25,(7,14):20,
-    (7,15):20,(7,16):31,(7,17):13,(7,18):31,(7,19):30,(7,20):48,(7,21):25,
+    (
+        36, 23, 31, 24, 31, 40, 25, 35, 57, 18, 40, 15, 25, 20,
+        20, 31, 13, 31, 30, 48, 25,
+    ),
     # ── I Samuel (8) ──
-    (8,1):28,(8,2):36,(8,3):21,(8,4):22,(8,5):12,(8,6):21,(8,7):17,
-    (8,8):22,(8,9):27,(8,10):27,(8,11):15,(8,12):25,(8,13):23,(8,14):52,
-    (8,15):35,(8,16):23,(8,17):58,(8,18):30,(8,19):24,(8,20):42,(8,21):16,
-    (8,22):23,(8,23):28,(8,24):23,(8,25):44,(8,26):25,(8,27):12,(8,28):25,
-    (8,29):11,(8,30):31,(8,31):13,
+    (
+        28, 36, 21, 22, 12, 21, 17, 22, 27, 27, 15, 25, 23, 52,
+        35, 23, 58, 30, 24, 42, 16, 23, 28, 23, 44, 25, 12, 25,
+        11, 31, 13,
+    ),
     # ── II Samuel (9) ──
-    (9,1):27,(9,2):32,(9,3):39,(9,4):12,(9,5):25,(9,6):23,(9,7):29,
-    (9,8):18,(9,9):13,(9,10):19,(9,11):27,(9,12):31,(9,13):39,(9,14):33,
-    (9,15):37,(9,16):23,(9,17):29,(9,18):32,(9,19):44,(9,20):26,(9,21):22,
-    (9,22):51,(9,23):39,(9,24):25,
+    (
+        27, 32, 39, 12, 25, 23, 29, 18, 13, 19, 27, 31, 39, 33,
+        37, 23, 29, 32, 44, 26, 22, 51, 39, 25,
+    ),
     # ── I Kings (10) ──
-    (10,1):53,(10,2):46,(10,3):28,(10,4):20,(10,5):32,(10,6):38,(10,7):51,
-    (10,8):66,(10,9):28,(10,10):29,(10,11):43,(10,12):33,(10,13):34,(10,14):31,
-    (10,15):34,(10,16):34,(10,17):24,(10,18):46,(10,19):21,(10,20):43,
-    (10,21):29,(10,22):54,
+    (
+        53, 46, 28, 20, 32, 38, 51, 66, 28, 29, 43, 33, 34, 31,
+        34, 34, 24, 46, 21, 43, 29, 54,
+    ),
     # ── II Kings (11) ──
-    (11,1):18,(11,2):25,(11,3):27,(11,4):44,(11,5):27,(11,6):33,(11,7):20,
-    (11,8):29,(11,9):37,(11,10):36,(11,11):20,(11,12):22,(11,13):25,
-    (11,14):29,(11,15):38,(11,16):20,(11,17):41,(11,18):37,(11,19):37,
-    (11,20):21,(11,21):26,(11,22):20,(11,23):37,(11,24):20,(11,25):30,
+    (
+        18, 25, 27, 44, 27, 33, 20, 29, 37, 36, 20, 22, 25, 29,
+        38, 20, 41, 37, 37, 21, 26, 20, 37, 20, 30,
+    ),
     # ── Isaiah (12) ──
-    (12,1):31,(12,2):22,(12,3):26,(12,4):6,(12,5):30,(12,6):13,(12,7):25,
-    (12,8):23,(12,9):20,(12,10):34,(12,11):16,(12,12):6,(12,13):22,(12,14):32,
-    (12,15):9,(12,16):14,(12,17):14,(12,18):7,(12,19):25,(12,20):6,
-    (12,21):17,(12,22):25,(12,23):18,(12,24):23,(12,25):12,(12,26):21,
-    (12,27):13,(12,28):29,(12,29):24,(12,30):33,(12,31):9,(12,32):20,
-    (12,33):24,(12,34):17,(12,35):10,(12,36):22,(12,37):38,(12,38):22,
-    (12,39):8,(12,40):31,(12,41):29,(12,42):25,(12,43):28,(12,44):28,
-    (12,45):25,(12,46):13,(12,47):15,(12,48):22,(12,49):26,(12,50):11,
-    (12,51):23,(12,52):15,(12,53):12,(12,54):17,(12,55):13,(12,56):12,
-    (12,57):21,(12,58):14,(12,59):21,(12,60):22,(12,61):11,(12,62):12,
-    (12,63):19,(12,64):11,(12,65):25,(12,66):24,
+    (
+        31, 22, 26, 6, 30, 13, 25, 23, 20, 34, 16, 6, 22, 32,
+        9, 14, 14, 7, 25, 6, 17, 25, 18, 23, 12, 21, 13, 29,
+        24, 33, 9, 20, 24, 17, 10, 22, 38, 22, 8, 31, 29, 25,
+        28, 28, 25, 13, 15, 22, 26, 11, 23, 15, 12, 17, 13, 12,
+        21, 14, 21, 22, 11, 12, 19, 11, 25, 24,
+    ),
     # ── Jeremiah (13) ──
-    (13,1):19,(13,2):37,(13,3):25,(13,4):31,(13,5):31,(13,6):30,
-    (13,7):34,(13,8):23,(13,9):25,(13,10):25,(13,11):23,(13,12):17,
-    (13,13):27,(13,14):22,(13,15):21,(13,16):21,(13,17):27,(13,18):23,
-    (13,19):15,(13,20):18,(13,21):14,(13,22):30,(13,23):40,(13,24):10,
-    (13,25):38,(13,26):24,(13,27):22,(13,28):17,(13,29):32,(13,30):24,
-    (13,31):40,(13,32):44,(13,33):26,(13,34):22,(13,35):19,(13,36):32,
-    (13,37):21,(13,38):28,(13,39):18,(13,40):16,(13,41):18,(13,42):22,
-    (13,43):13,(13,44):30,(13,45):5,(13,46):28,(13,47):7,(13,48):47,
-    (13,49):39,(13,50):46,(13,51):64,(13,52):34,
+    (
+        19, 37, 25, 31, 31, 30, 34, 23, 25, 25, 23, 17, 27, 22,
+        21, 21, 27, 23, 15, 18, 14, 30, 40, 10, 38, 24, 22, 17,
+        32, 24, 40, 44, 26, 22, 19, 32, 21, 28, 18, 16, 18, 22,
+        13, 30, 5, 28, 7, 47, 39, 46, 64, 34,
+    ),
     # ── Ezekiel (14) ──
-    (14,1):28,(14,2):10,(14,3):27,(14,4):17,(14,5):17,(14,6):14,
-    (14,7):27,(14,8):18,(14,9):11,(14,10):22,(14,11):25,(14,12):28,
-    (14,13):23,(14,14):23,(14,15):8,(14,16):63,(14,17):24,(14,18):32,
-    (14,19):14,(14,20):44,(14,21):37,(14,22):31,(14,23):49,(14,24):27,
-    (14,25):17,(14,26):21,(14,27):36,(14,28):26,(14,29):21,(14,30):26,
-    (14,31):18,(14,32):32,(14,33):33,(14,34):31,(14,35):15,(14,36):38,
-    (14,37):28,(14,38):23,(14,39):29,(14,40):49,(14,41):26,(14,42):20,
-    (14,43):27,(14,44):31,(14,45):25,(14,46):24,(14,47):23,(14,48):35,
+    (
+        28, 10, 27, 17, 17, 14, 27, 18, 11, 22, 25, 28, 23, 23,
+        8, 63, 24, 32, 14, 44, 37, 31, 49, 27, 17, 21, 36, 26,
+        21, 26, 18, 32, 33, 31, 15, 38, 28, 23, 29, 49, 26, 20,
+        27, 31, 25, 24, 23, 35,
+    ),
     # ── Hosea (15) ──
-    (15,1):9,(15,2):25,(15,3):5,(15,4):19,(15,5):15,(15,6):11,
-    (15,7):16,(15,8):14,(15,9):17,(15,10):15,(15,11):11,(15,12):15,
-    (15,13):15,(15,14):10,
+    (
+        9, 25, 5, 19, 15, 11, 16, 14, 17, 15, 11, 15, 15, 10,
+    ),
     # ── Joel (16) ──
-    (16,1):20,(16,2):27,(16,3):5,(16,4):21,
+    (
+        20, 27, 5, 21,
+    ),
     # ── Amos (17) ──
-    (17,1):15,(17,2):16,(17,3):15,(17,4):13,(17,5):27,(17,6):14,
-    (17,7):17,(17,8):14,(17,9):15,
+    (
+        15, 16, 15, 13, 27, 14, 17, 14, 15,
+    ),
     # ── Obadiah (18) ──
-    (18,1):21,
+    (
+        21,
+    ),
     # ── Jonah (19) ──
-    (19,1):16,(19,2):11,(19,3):10,(19,4):11,
+    (
+        16, 11, 10, 11,
+    ),
     # ── Micah (20) ──
-    (20,1):16,(20,2):13,(20,3):12,(20,4):14,(20,5):14,(20,6):16,(20,7):20,
+    (
+        16, 13, 12, 14, 14, 16, 20,
+    ),
     # ── Nahum (21) ──
-    (21,1):14,(21,2):14,(21,3):19,
+    (
+        14, 14, 19,
+    ),
     # ── Habakkuk (22) ──
-    (22,1):17,(22,2):20,(22,3):19,
+    (
+        17, 20, 19,
+    ),
     # ── Zephaniah (23) ──
-    (23,1):18,(23,2):15,(23,3):20,
+    (
+        18, 15, 20,
+    ),
     # ── Haggai (24) ──
-    (24,1):15,(24,2):23,
+    (
+        15, 23,
+    ),
     # ── Zechariah (25) ──
-    (25,1):17,(25,2):17,(25,3):10,(25,4):14,(25,5):11,(25,6):15,
-    (25,7):14,(25,8):23,(25,9):17,(25,10):12,(25,11):17,(25,12):14,
-    (25,13):9,(25,14):21,
+    (
+        17, 17, 10, 14, 11, 15, 14, 23, 17, 12, 17, 14, 9, 21,
+    ),
     # ── Malachi (26) ──
-    (26,1):14,(26,2):17,(26,3):24,
+    (
+        14, 17, 24,
+    ),
+    # ── Psalms/Tehillim (27) ──  [WLC: 150 chapters, 2527 verses]
+    (
+        6, 12, 9, 9, 13, 11, 18, 10, 21, 18, 7, 9, 6, 7,
+        5, 11, 15, 51, 15, 10, 14, 32, 6, 10, 22, 12, 14, 9,
+        11, 13, 25, 11, 22, 23, 28, 13, 40, 23, 14, 18, 14, 12,
+        5, 27, 18, 12, 10, 15, 21, 23, 21, 11, 7, 9, 24, 14,
+        12, 12, 18, 14, 9, 13, 12, 11, 14, 20, 8, 36, 37, 6,
+        24, 20, 28, 23, 11, 13, 21, 72, 13, 20, 17, 8, 19, 13,
+        14, 17, 7, 19, 53, 17, 16, 16, 5, 23, 11, 13, 12, 9,
+        9, 5, 8, 29, 22, 35, 45, 48, 43, 14, 31, 7, 10, 10,
+        9, 8, 18, 19, 2, 29, 176, 7, 8, 9, 4, 8, 5, 6,
+        5, 6, 8, 8, 3, 18, 3, 3, 21, 26, 9, 8, 24, 14,
+        10, 8, 12, 15, 21, 10, 20, 14, 9, 6,
+    ),
+    # ── Proverbs (28) ──
+    (
+        33, 22, 35, 27, 23, 35, 27, 36, 18, 32, 31, 28, 25, 35,
+        33, 33, 28, 24, 29, 30, 31, 29, 35, 34, 28, 28, 27, 28,
+        27, 33, 31,
+    ),
+    # ── Job (29) ──
+    (
+        22, 13, 26, 21, 27, 30, 21, 22, 35, 22, 20, 25, 28, 22,
+        35, 22, 16, 21, 29, 29, 34, 30, 17, 25, 6, 14, 23, 28,
+        25, 31, 40, 22, 33, 37, 16, 33, 24, 41, 30, 32, 26, 17,
+    ),
     # ── Ruth (30) ──
-    (30,1):22,(30,2):23,(30,3):18,(30,4):22,
+    (
+        22, 23, 18, 22,
+    ),
     # ── Lamentations (31) ──
-    (31,1):22,(31,2):22,(31,3):66,(31,4):22,(31,5):22,
+    (
+        22, 22, 66, 22, 22,
+    ),
     # ── Kohelet / Ecclesiastes (32) ──
-    (32,1):18,(32,2):26,(32,3):22,(32,4):17,(32,5):19,(32,6):12,
-    (32,7):29,(32,8):17,(32,9):18,(32,10):20,(32,11):10,(32,12):14,
+    (
+        18, 26, 22, 17, 19, 12, 29, 17, 18, 20, 10, 14,
+    ),
     # ── Esther (33) ──
-    (33,1):22,(33,2):23,(33,3):15,(33,4):17,(33,5):14,(33,6):14,
-    (33,7):10,(33,8):17,(33,9):32,(33,10):3,
+    (
+        22, 23, 15, 17, 14, 14, 10, 17, 32, 3,
+    ),
     # ── Song of Songs (34) ──
-    (34,1):17,(34,2):17,(34,3):11,(34,4):16,(34,5):16,(34,6):12,
-    (34,7):14,(34,8):14,
+    (
+        17, 17, 11, 16, 16, 12, 14, 14,
+    ),
     # ── Nehemiah (35) ──
-    (35,1):11,(35,2):20,(35,3):38,(35,4):17,(35,5):19,(35,6):19,
-    (35,7):72,(35,8):18,(35,9):37,(35,10):40,(35,11):36,(35,12):47,
-    (35,13):31,
-    # ── Psalms/Tehillim (27) ──  [WLC: 150 chapters, 2527 verses]
-    (27,1):6,(27,2):12,(27,3):9,(27,4):9,(27,5):13,(27,6):11,(27,7):18,(27,8):10,(27,9):21,(27,10):18,
-    (27,11):7,(27,12):9,(27,13):6,(27,14):7,(27,15):5,(27,16):11,(27,17):15,(27,18):51,(27,19):15,(27,20):10,
-    (27,21):14,(27,22):32,(27,23):6,(27,24):10,(27,25):22,(27,26):12,(27,27):14,(27,28):9,(27,29):11,(27,30):13,
-    (27,31):25,(27,32):11,(27,33):22,(27,34):23,(27,35):28,(27,36):13,(27,37):40,(27,38):23,(27,39):14,(27,40):18,
-    (27,41):14,(27,42):12,(27,43):5,(27,44):27,(27,45):18,(27,46):12,(27,47):10,(27,48):15,(27,49):21,(27,50):23,
-    (27,51):21,(27,52):11,(27,53):7,(27,54):9,(27,55):24,(27,56):14,(27,57):12,(27,58):12,(27,59):18,(27,60):14,
-    (27,61):9,(27,62):13,(27,63):12,(27,64):11,(27,65):14,(27,66):20,(27,67):8,(27,68):36,(27,69):37,(27,70):6,
-    (27,71):24,(27,72):20,(27,73):28,(27,74):23,(27,75):11,(27,76):13,(27,77):21,(27,78):72,(27,79):13,(27,80):20,
-    (27,81):17,(27,82):8,(27,83):19,(27,84):13,(27,85):14,(27,86):17,(27,87):7,(27,88):19,(27,89):53,(27,90):17,
-    (27,91):16,(27,92):16,(27,93):5,(27,94):23,(27,95):11,(27,96):13,(27,97):12,(27,98):9,(27,99):9,(27,100):5,
-    (27,101):8,(27,102):29,(27,103):22,(27,104):35,(27,105):45,(27,106):48,(27,107):43,(27,108):14,(27,109):31,(27,110):7,
-    (27,111):10,(27,112):10,(27,113):9,(27,114):8,(27,115):18,(27,116):19,(27,117):2,(27,118):29,(27,119):176,(27,120):7,
-    (27,121):8,(27,122):9,(27,123):4,(27,124):8,(27,125):5,(27,126):6,(27,127):5,(27,128):6,(27,129):8,(27,130):8,
-    (27,131):3,(27,132):18,(27,133):3,(27,134):3,(27,135):21,(27,136):26,(27,137):9,(27,138):8,(27,139):24,(27,140):14,
-    (27,141):10,(27,142):8,(27,143):12,(27,144):15,(27,145):21,(27,146):10,(27,147):20,(27,148):14,(27,149):9,(27,150):6,
-    # ── Proverbs (28) ──
-    (28,1):33,(28,2):22,(28,3):35,(28,4):27,(28,5):23,(28,6):35,(28,7):27,(28,8):36,(28,9):18,(28,10):32,
-    (28,11):31,(28,12):28,(28,13):25,(28,14):35,(28,15):33,(28,16):33,(28,17):28,(28,18):24,(28,19):29,(28,20):30,
-    (28,21):31,(28,22):29,(28,23):35,(28,24):34,(28,25):28,(28,26):28,(28,27):27,(28,28):28,(28,29):27,(28,30):33,
-    (28,31):31,
-    # ── Job (29) ──
-    (29,1):22,(29,2):13,(29,3):26,(29,4):21,(29,5):27,(29,6):30,(29,7):21,(29,8):22,(29,9):35,(29,10):22,
-    (29,11):20,(29,12):25,(29,13):28,(29,14):22,(29,15):35,(29,16):22,(29,17):16,(29,18):21,(29,19):29,(29,20):29,
-    (29,21):34,(29,22):30,(29,23):17,(29,24):25,(29,25):6,(29,26):14,(29,27):23,(29,28):28,(29,29):25,(29,30):31,
-    (29,31):40,(29,32):22,(29,33):33,(29,34):37,(29,35):16,(29,36):33,(29,37):24,(29,38):41,(29,39):30,(29,40):32,
-    (29,41):26,(29,42):17,
+    (
+        11, 20, 38, 17, 19, 19, 72, 18, 37, 40, 36, 47, 31,
+    ),
     # ── Ezra (36) ──
-    (36,1):11,(36,2):70,(36,3):13,(36,4):24,(36,5):17,(36,6):22,(36,7):28,(36,8):36,(36,9):15,(36,10):44,
+    (
+        11, 70, 13, 24, 17, 22, 28, 36, 15, 44,
+    ),
     # ── I Chronicles (37) ──
-    (37,1):54,(37,2):55,(37,3):24,(37,4):43,(37,5):41,(37,6):66,(37,7):40,(37,8):40,(37,9):44,(37,10):14,
-    (37,11):47,(37,12):41,(37,13):14,(37,14):17,(37,15):29,(37,16):43,(37,17):27,(37,18):17,(37,19):19,(37,20):8,
-    (37,21):30,(37,22):19,(37,23):32,(37,24):31,(37,25):31,(37,26):32,(37,27):34,(37,28):21,(37,29):30,
+    (
+        54, 55, 24, 43, 41, 66, 40, 40, 44, 14, 47, 41, 14, 17,
+        29, 43, 27, 17, 19, 8, 30, 19, 32, 31, 31, 32, 34, 21,
+        30,
+    ),
     # ── II Chronicles (38) ──
-    (38,1):18,(38,2):17,(38,3):17,(38,4):22,(38,5):14,(38,6):42,(38,7):22,(38,8):18,(38,9):31,(38,10):19,
-    (38,11):23,(38,12):16,(38,13):23,(38,14):14,(38,15):19,(38,16):14,(38,17):19,(38,18):34,(38,19):11,(38,20):37,
-    (38,21):20,(38,22):12,(38,23):21,(38,24):27,(38,25):28,(38,26):23,(38,27):9,(38,28):27,(38,29):36,(38,30):27,
-    (38,31):21,(38,32):33,(38,33):25,(38,34):33,(38,35):27,(38,36):23,
-}
+    (
+        18, 17, 17, 22, 14, 42, 22, 18, 31, 19, 23, 16, 23, 14,
+        19, 14, 19, 34, 11, 37, 20, 12, 21, 27, 28, 23, 9, 27,
+        36, 27, 21, 33, 25, 33, 27, 23,
+    ),
+)
 
 
 def build_verse_metadata(
@@ -965,7 +1266,7 @@ def build_verse_metadata(
 
     Counts ``verse_end`` flags to advance verse and chapter numbers.
     When *book_num* is supplied (1–5 for the five books of Moses), the
-    chapter boundary is looked up from ``_TORAH_CHAPTER_LENGTHS`` and
+    chapter boundary is looked up in ``_CHAPTER_LENGTHS`` and
     the chapter number is incremented automatically whenever the verse
     counter exceeds the known chapter length.
 
@@ -998,15 +1299,21 @@ def build_verse_metadata(
     current_aliyah_num = 0
     current_aliyah_name = ""
     is_verse_start = True
+    boundary_get = aliyah_boundaries.get
+    append = metadata.append
+    # Verse counts of the book's chapters, empty when the book is unknown
+    book_lens: Tuple[int, ...] = (
+        _CHAPTER_LENGTHS[book_num] if 0 < book_num < len(_CHAPTER_LENGTHS) else ())
+    n_chapters = len(book_lens)
 
     for token in tokens:
         # ── Look up aliyah boundary ──
         if _use_cv_keys:
             # Key is (chapter, verse) – exact Torah position.
-            aliyah_info = aliyah_boundaries.get((chapter, verse))
+            aliyah_info = boundary_get((chapter, verse))
         else:
             # Legacy: key is 0-based verse index.
-            aliyah_info = aliyah_boundaries.get(verse_idx)
+            aliyah_info = boundary_get(verse_idx)
 
         is_aliyah_start = False
         if aliyah_info is not None and aliyah_info[0] != current_aliyah_num:
@@ -1014,7 +1321,7 @@ def build_verse_metadata(
             current_aliyah_name = aliyah_info[1]
             is_aliyah_start = True
 
-        metadata.append({
+        append({
             "chapter": chapter,
             "verse": verse,
             "is_verse_start": is_verse_start,
@@ -1030,10 +1337,9 @@ def build_verse_metadata(
             is_verse_start = True
 
             # ── Chapter boundary check ──
-            if book_num > 0:
-                chapter_max = _TORAH_CHAPTER_LENGTHS.get(
-                    (book_num, chapter), 999
-                )
+            if book_lens:
+                chapter_max = (book_lens[chapter - 1]
+                               if 0 < chapter <= n_chapters else 999)
                 if verse > chapter_max:
                     chapter += 1
                     verse = 1
@@ -0,0 +1,121 @@
+"""Tests for the pure helpers of :mod:`taamimflow.gui.open_reading_dialog`."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtCore import QDate  # noqa: E402
+
+from taamimflow.gui import open_reading_dialog as ord_  # noqa: E402
+
+# Spans several 19-year cycles, so every year length and leap pattern occurs
+_FIRST = dt.date(1990, 1, 1)
+_LAST = dt.date(2060, 1, 1)
+
+
+def _jd_range(step: int = 1):
+    """Yield ``(date, julian_day)`` pairs from _FIRST up to _LAST."""
+    jd = QDate(_FIRST.year, _FIRST.month, _FIRST.day).toJulianDay()
+    day = _FIRST
+    while day < _LAST:
+        yield day, jd
+        day += dt.timedelta(days=step)
+        jd += step
+
+
+# ── Hebrew dates ─────────────────────────────────────────────────────
+
+def test_hebrew_parts_arithmetic_matches_pyluach():
+    dates = pytest.importorskip("pyluach.dates")
+    for day, jd in _jd_range():
+        hd = dates.GregorianDate(day.year, day.month, day.day).to_heb()
+        if hd.month == 12 and ord_._is_hebrew_leap_year(hd.year):
+            month = "Adar I"
+        else:
+            month = ord_._PYLUACH_MONTH_NAMES[hd.month]
+        assert ord_._hebrew_parts_arithmetic(jd) == (hd.day, month, hd.year), day
+
+
+def test_hebrew_parts_run_matches_single_days():
+    first_jd = QDate(2023, 8, 1).toJulianDay()
+    # Crosses two Rosh Hashanas, including the leap year 5784
+    run = ord_._hebrew_parts_run(first_jd, 800)
+    assert run == [ord_._hebrew_parts_arithmetic(first_jd + i) for i in range(800)]
+
+
+@pytest.mark.skipif(not ord_._HC_AVAILABLE, reason="hebrew_calendar.py not found")
+def test_hebrew_date_for_jd_matches_hebrew_calendar():
+    # The string shown before memoisation came straight from hebrew_calendar,
+    # which is slow per call, so the range is sampled
+    for day, jd in _jd_range(step=61):
+        expected = ord_._hc_date_str(day.year, day.month, day.day)
+        assert ord_._hebrew_date_for_jd(jd) == expected, day
+
+
+# ── sedrot.xml ───────────────────────────────────────────────────────
+
+_SEDROT_SAMPLE = """\
+<READINGS>
+  <READING NAME="Bereishis">
+    <OPTION TYPE="Torah" CYCLE="0" NAME="Shabbas"/>
+    <OPTION TYPE="Torah" CYCLE="0" NAME="Shabbas"/>
+    <OPTION TYPE="Torah" CYCLE="1" NAME="Shabbas Triennial year 1"/>
+    <OPTION TYPE="Torah" CYCLE="1STS" NAME="Shabbas Shuva"/>
+    <OPTION TYPE="Torah" CYCLE="4" NAME="Weekday"/>
+    <OPTION TYPE="Torah" CYCLE="0" SPECIAL="RC" NAME="Shabbas Rosh Chodesh"/>
+    <OPTION TYPE="Maftir" CYCLE="0" NAME="Standard"/>
+    <OPTION TYPE="Maftir" CYCLE="4" NAME="Weekday"/>
+    <OPTION TYPE="Haftarah" NAME="Most Ashkenazim"/>
+    <OPTION TYPE="Haftarah" SPECIAL="RC" NAME="Rosh Chodesh"/>
+    <OPTION TYPE="Haftarah" NAME="Most Ashkenazim"/>
+    <OPTION TYPE="Unknown" NAME="Ignored"/>
+    <OPTION TYPE="Torah" CYCLE="0" NAME=""/>
+  </READING>
+  <READING NAME="Purim">
+    <OPTION TYPE="Esther" NAME="Megillas Esther"/>
+    <OPTION TYPE="Esther" NAME="Megillas Esther"/>
+  </READING>
+  <READING NAME="">
+    <OPTION TYPE="Torah" CYCLE="0" NAME="Nameless"/>
+  </READING>
+</READINGS>
+"""
+
+
+def test_parse_sedrot_xml_dedupes_and_filters_cycles(tmp_path):
+    path = tmp_path / "sedrot.xml"
+    path.write_text(_SEDROT_SAMPLE, encoding="utf-8")
+
+    options = ord_._parse_sedrot_xml(str(path))
+
+    assert list(options) == ["Bereishis", "Purim"]
+    opts = options["Bereishis"]
+    assert opts.torah == ("Shabbas", "Weekday")
+    assert opts.all_torah == (
+        "Shabbas",
+        "Shabbas Triennial year 1",
+        "Shabbas Shuva",
+        "Weekday",
+        "Shabbas Rosh Chodesh",
+    )
+    assert opts.maftir == ("Standard",)
+    assert opts.all_maftir == ("Standard", "Weekday")
+    # Haftarah options have no CYCLE filter, so SPECIAL ones stay
+    assert opts.haftarah == ("Most Ashkenazim", "Rosh Chodesh")
+    assert opts.all_haftarah == ("Most Ashkenazim", "Rosh Chodesh")
+
+    purim = options["Purim"]
+    assert purim.all_torah == ("Megillas Esther",)
+    assert purim.torah == ()
+
+
+def test_load_sedrot_xml_fills_bundled_options():
+    if ord_._find_sedrot_xml() is None:
+        pytest.skip("sedrot.xml not found")
+    opts = ord_._SEDROT_OPTIONS["Bereishis"]
+    assert "Shabbas" in opts.torah
+    assert len(set(opts.all_torah)) == len(opts.all_torah)
@@ -0,0 +1,253 @@
+"""Tests for the pure helpers of :mod:`taamimflow.gui.text_widget`."""
+
+from __future__ import annotations
+
+import os
+import random
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from taamimflow.gui import text_widget as tw  # noqa: E402
+from taamimflow.utils.trope_parser import Token  # noqa: E402
+
+
+# ── build_verse_metadata ─────────────────────────────────────────────
+
+def _legacy_verse_metadata(
+    tokens: List[Token],
+    starting_chapter: int,
+    starting_verse: int,
+    aliyah_boundaries: Optional[Dict],
+    book_num: int,
+    chapter_lengths: Dict[Tuple[int, int], int],
+) -> List[dict]:
+    """build_verse_metadata as it was with the (book, chapter) dict."""
+    aliyah_boundaries = aliyah_boundaries or {}
+    keys = list(aliyah_boundaries)
+    use_cv_keys = bool(keys) and isinstance(keys[0], tuple)
+    metadata: List[dict] = []
+    chapter, verse, verse_idx = starting_chapter, starting_verse, 0
+    aliyah_num, aliyah_name = 0, ""
+    is_verse_start = True
+    for token in tokens:
+        info = aliyah_boundaries.get((chapter, verse) if use_cv_keys else verse_idx)
+        is_aliyah_start = False
+        if info is not None and info[0] != aliyah_num:
+            aliyah_num, aliyah_name = info
+            is_aliyah_start = True
+        metadata.append({
+            "chapter": chapter,
+            "verse": verse,
+            "is_verse_start": is_verse_start,
+            "aliyah_num": aliyah_num,
+            "aliyah_name": aliyah_name,
+            "is_aliyah_start": is_aliyah_start,
+        })
+        is_verse_start = False
+        if token.verse_end:
+            verse += 1
+            verse_idx += 1
+            is_verse_start = True
+            if book_num > 0:
+                if verse > chapter_lengths.get((book_num, chapter), 999):
+                    chapter += 1
+                    verse = 1
+    return metadata
+
+
+def test_chapter_lengths_keep_the_torah_verse_counts():
+    assert len(tw._CHAPTER_LENGTHS) == 39
+    assert tw._CHAPTER_LENGTHS[0] == ()
+    assert [len(book) for book in tw._CHAPTER_LENGTHS[1:6]] == [50, 40, 27, 36, 34]
+    assert [sum(book) for book in tw._CHAPTER_LENGTHS[1:5]] == [1533, 1210, 859, 1288]
+    assert tw._CHAPTER_LENGTHS[27][118] == 176  # Psalms 119
+
+
+def test_build_verse_metadata_matches_chapter_dict_lookup():
+    old_table = {
+        (book, chapter): n
+        for book, lens in enumerate(tw._CHAPTER_LENGTHS)
+        for chapter, n in enumerate(lens, 1)
+    }
+    rng = random.Random(1234)
+    for _ in range(200):
+        # Include unknown books and chapters past the end of a book
+        book = rng.choice((0, 1, 2, 5, 19, 27, 38, 39, 120))
+        lens = tw._CHAPTER_LENGTHS[book] if book < len(tw._CHAPTER_LENGTHS) else ()
+        chapter = rng.randint(1, len(lens) + 2)
+        verse = rng.randint(1, 5)
+        ends = [rng.random() < 0.3 for _ in range(rng.randint(0, 400))]
+        tokens = [Token("x", "", "", "", [], end) for end in ends]
+        boundaries = rng.choice((
+            None,
+            {(chapter, verse): (1, "Kohen"), (chapter, verse + 3): (2, "Levi")},
+            {0: (1, "Kohen"), 4: (2, "Levi")},
+        ))
+        assert tw.build_verse_metadata(
+            tokens, chapter, verse, boundaries, book,
+        ) == _legacy_verse_metadata(
+            tokens, chapter, verse, boundaries, book, old_table,
+        )
+
+
+def test_build_verse_metadata_wraps_chapters():
+    # Genesis 1:31 is the last verse of its chapter
+    tokens = [Token("x", "", "", "", [], True) for _ in range(3)]
+    meta = tw.build_verse_metadata(tokens, 1, 30, book_num=1)
+    assert [(m["chapter"], m["verse"]) for m in meta] == [(1, 30), (1, 31), (2, 1)]
+
+
+# ── _build_tikkun_html ───────────────────────────────────────────────
+
+# Genesis 1:1–1:3 with vowels and cantillation
+_WORDS = (
+    "בְּרֵאשִׁ֖ית", "בָּרָ֣א", "אֱלֹהִ֑ים", "אֵ֥ת", "הַשָּׁמַ֖יִם", "וְאֵ֥ת", "הָאָֽרֶץ׃",
+    "וְהָאָ֗רֶץ", "הָיְתָ֥ה", "תֹ֙הוּ֙", "וָבֹ֔הוּ", "וְחֹ֖שֶׁךְ", "עַל־פְּנֵ֣י",
+    "תְה֑וֹם", "וְר֣וּחַ", "אֱלֹהִ֔ים", "מְרַחֶ֖פֶת", "עַל־פְּנֵ֥י", "הַמָּֽיִם׃",
+    "וַיֹּ֥אמֶר", "אֱלֹהִ֖ים", "יְהִ֣י", "א֑וֹר", "וַֽיְהִי־אֽוֹר׃",
+)
+
+
+def _tokens(words=_WORDS) -> List[Token]:
+    return [Token(w, "", "", "", [], w.endswith("׃")) for w in words]
+
+
+def _legacy_tikkun_html(
+    words: List[str],
+    metadata: List[dict],
+    stam_font_name: str,
+) -> str:
+    """Tikkun table HTML as it was built with inline cell styles."""
+    if metadata:
+        verses: List[Tuple[List[int], dict]] = []
+        current: List[int] = []
+        current_meta: dict = {}
+        for idx, meta in enumerate(metadata):
+            if meta and meta.get("is_verse_start") and current:
+                verses.append((current, current_meta))
+                current = []
+            current_meta = meta or {}
+            current.append(idx)
+        if current:
+            verses.append((current, current_meta))
+    else:
+        verses = [(list(range(len(words))), {})]
+
+    rows_html = ""
+    last_aliyah = -1
+    for indices, meta in verses:
+        aliyah_num = meta.get("aliyah_num", 0)
+        if aliyah_num and aliyah_num != last_aliyah and meta.get("is_aliyah_start"):
+            last_aliyah = aliyah_num
+            color_hex = tw.ALIYAH_BANNER_COLORS.get(aliyah_num, "#555555")
+            display_name = meta.get("aliyah_name") or tw.ALIYAH_NAMES.get(aliyah_num)
+            rows_html += (
+                f"<tr><td colspan='3' style='"
+                f"background-color:{color_hex}; color:white; font-size:11pt; "
+                f"font-weight:bold; text-align:center; padding:6px;'>"
+                f"── {display_name}  (Aliyah {aliyah_num}) ──"
+                f"</td></tr>"
+            )
+        chapter = meta.get("chapter", "")
+        verse = meta.get("verse", "")
+        verse_label = f"{chapter}:{verse}" if chapter and verse else ""
+        modern_words = " ".join(words[i] for i in indices)
+        stam_words = " ".join(
+            "".join(ch for ch in words[i] if unicodedata.combining(ch) == 0)
+            for i in indices
+        )
+        rows_html += (
+            f"<tr>"
+            f"<td style='width:8%; color:#A0A0A0; font-size:10pt; "
+            f"  text-align:center; vertical-align:top; padding:4px;'>"
+            f"  {verse_label}"
+            f"</td>"
+            f"<td style='width:46%; padding:8px; text-align:right; "
+            f"  font-size:20pt; font-family:Times New Roman; "
+            f"  color:white; direction:rtl; vertical-align:top;'>"
+            f"  {modern_words}"
+            f"</td>"
+            f"<td style='width:46%; padding:8px; text-align:right; "
+            f"  font-size:22pt; font-family:\"{stam_font_name}\"; "
+            f"  color:white; direction:rtl; vertical-align:top;'>"
+            f"  {stam_words}"
+            f"</td>"
+            f"</tr>"
+        )
+    return (
+        "<table width='100%' border='0' style='"
+        "border-collapse:collapse; background-color:#1a1a2e;'>"
+        "<tr>"
+        "<th style='color:#A0A0A0; font-size:10pt; padding:4px;'>#</th>"
+        "<th style='color:#D0D0D0; font-size:11pt; padding:4px;'>Modern</th>"
+        "<th style='color:#D0D0D0; font-size:11pt; padding:4px;'>STAM Sefarad</th>"
+        "</tr>"
+        + rows_html
+        + "</table>"
+    )
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+def _document_html(html: str) -> str:
+    from PyQt6.QtGui import QTextDocument
+    doc = QTextDocument()
+    doc.setHtml(html)
+    return doc.toHtml()
+
+
+def _reading(words=_WORDS) -> Tuple[List[str], List[str], List[dict]]:
+    tokens = _tokens(words)
+    metadata = tw.build_verse_metadata(
+        tokens, 1, 1, {(1, 1): (1, "Kohen"), (1, 3): (2, "Levi")}, book_num=1)
+    words = [t.word for t in tokens]
+    return words, [tw._strip_diacritics(w) for w in words], metadata
+
+
+@pytest.mark.parametrize("reading", ["verses", "one_word_verses", "no_metadata"])
+def test_tikkun_html_builds_the_same_document(qapp, reading):
+    if reading == "one_word_verses":
+        # A verse's banner comes from its last token, so this is the case
+        # that shows aliyah banners
+        words, stripped, metadata = _reading(tuple(w + "׃" for w in _WORDS[:4]))
+        assert sum(m["is_aliyah_start"] for m in metadata) == 2
+    else:
+        words, stripped, metadata = _reading()
+    if reading == "no_metadata":
+        metadata = []
+    html = tw._build_tikkun_html(words, stripped, metadata, "Stam Sefarad")
+    legacy = _legacy_tikkun_html(words, metadata, "Stam Sefarad")
+    assert _document_html(html) == _document_html(legacy)
+
+
+def test_tikkun_html_rows():
+    words, stripped, metadata = _reading()
+    html = tw._build_tikkun_html(words, stripped, metadata, "Stam Sefarad")
+
+    assert html.count("<tr>") == 4  # header + three verses
+    for label in ("1:1", "1:2", "1:3"):
+        assert f"<td class='vnum'>  {label}</td>" in html
+    assert f"<td class='mod'>  {' '.join(words[:7])}</td>" in html
+    assert f"<td class='stam'>  {' '.join(stripped[19:])}</td>" in html
+    assert 'font-family:"Stam Sefarad"' in html
+
+
+def test_tikkun_html_escapes_text():
+    words = ["a<b&c"]
+    metadata = [
+        {"chapter": 1, "verse": 1, "is_verse_start": True,
+         "aliyah_num": 1, "aliyah_name": "<Kohen>", "is_aliyah_start": True},
+    ]
+    html = tw._build_tikkun_html(words, words, metadata, "Stam")
+    assert "<td class='mod'>  a&lt;b&amp;c</td>" in html
+    assert "── &lt;Kohen&gt;  (Aliyah 1) ──" in html
+    assert "a<b" not in html